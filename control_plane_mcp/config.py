@@ -1,6 +1,53 @@
 """Configuration module for Control Plane MCP Server."""
 
+import functools
+import inspect
+
+import anyio.to_thread
 from mcp.server.fastmcp import FastMCP
 
-# Initialize FastMCP with a static name
-mcp = FastMCP("FacetCPGenie")
\ No newline at end of file
+from .utils.client_utils import ClientUtils
+
+
+def _call_with_context_snapshot(fn, *args, **kwargs):
+    """
+    Call fn with the current project and environment pinned for the duration of the call.
+    """
+    with ClientUtils.context_snapshot():
+        return fn(*args, **kwargs)
+
+
+def _run_in_worker_thread(fn):
+    """
+    Wrap a synchronous function in a coroutine that runs it in a worker thread.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await anyio.to_thread.run_sync(functools.partial(_call_with_context_snapshot, fn, *args, **kwargs))
+
+    return wrapper
+
+
+class ThreadedFastMCP(FastMCP):
+    """
+    FastMCP that runs synchronous tools in worker threads.
+
+    Tools call the blocking swagger client; running them on the event loop would
+    stall every other request (and, over streamable-http, every other client)
+    until the API call returns. The decorated function itself is left unchanged,
+    so tools can still call each other directly.
+
+    Each call sees the current project and environment as they were when it
+    started, so a concurrent use_project() or use_environment() cannot switch
+    the project of a tool that is already running.
+    """
+
+    def add_tool(self, fn, *args, **kwargs):
+        if not inspect.iscoroutinefunction(fn):
+            fn = _run_in_worker_thread(fn)
+        super().add_tool(fn, *args, **kwargs)
+
+
+# Initialize FastMCP with a static name. Tools register on it when control_plane_mcp.tools is
+# imported, which control_plane_mcp.server does at import time
+mcp = ThreadedFastMCP("FacetCPGenie")
@@ -4,7 +4,6 @@ import logging
 import os
 
 import click
-import swagger_client
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,28 +12,13 @@ load_dotenv()
 from .config import mcp
 from .utils.client_utils import ClientUtils
 
-# Now import tools - they will register with the MCP instance
-from .tools import *
+# Import tools at module level so they register with the MCP instance for every entry path
+# (this CLI, `mcp dev`/`mcp run`, or embedding the server)
+from . import tools  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
 
-def _test_login() -> bool:
-    """
-    Test login using the ApplicationController.
-
-    Returns:
-        bool: True if login is successful, False otherwise.
-    """
-    try:
-        api_instance = swagger_client.ApplicationControllerApi(ClientUtils.get_client())
-        api_instance.me()
-        return True
-    except Exception as e:
-        logger.error(f"Login test failed: {e}")
-        return False
-
-
 @click.command()
 @click.option(
     '--transport',
@@ -99,13 +83,13 @@ def main(
     try:
         ClientUtils.initialize()
         # Test authentication
-        if not _test_login():
+        if not ClientUtils.test_login():
             logger.error("Authentication failed.")
             exit(1)
     except Exception as e:
         logger.error(f"Failed to initialize client configuration: {e}")
         exit(1)
-    
+
     # Log startup information
     if transport == 'streamable-http':
         logger.info(f"Starting Facets Control Plane MCP server on http://{host}:{port}/mcp")
@@ -115,7 +99,10 @@ def main(
         logger.info("Starting Facets Control Plane MCP server with stdio transport")
     
     # Run the server with specified transport
-    mcp.run(transport=transport)
+    try:
+        mcp.run(transport=transport)
+    finally:
+        ClientUtils.close_client()
 
 
 if __name__ == "__main__":
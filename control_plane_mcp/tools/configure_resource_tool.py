@@ -43,15 +43,62 @@ and patterns the organization has designed for their infrastructure abstractions
 from ..utils.client_utils import ClientUtils
 from ..config import mcp
 import swagger_client
-from swagger_client.models import ResourceFileRequest, UpdateBlueprintRequest
-from typing import List, Dict, Any, Optional, Annotated
-import json
+from swagger_client.models import Info, ResourceFileRequest, UpdateBlueprintRequest
+from typing import List, Dict, Any, Optional, Annotated, Tuple
+import copy
+import orjson
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from ..utils.validation_utils import validate_resource, validate_resource_with_public_schema, get_schema_validation_summary
+from ..utils.cache_utils import TTLCache
 from mcp.shared.exceptions import McpError
 from mcp.types import ErrorData, INVALID_REQUEST
 from pydantic import BaseModel, Field
 
 
+# Available modules per project, keyed by project name
+_available_resources_cache = TTLCache(ttl=60)
+
+# Formatted resources, keyed by (project name, resource type, resource name)
+_resource_cache = TTLCache(ttl=30, maxsize=512)
+
+# Parsed (spec, sample) of modules, keyed by (intent, flavor, version, project name)
+_module_cache = TTLCache(ttl=300, maxsize=256)
+
+# Formatted module inputs, keyed by (project name, resource type, flavor). Compatible resources
+# change when resources are added or removed, so the cache is cleared on those operations
+_module_inputs_cache = TTLCache(ttl=60, maxsize=256)
+
+# Public module schemas, keyed by (intent, flavor, version). Returning the same dict for a module
+# also lets the schema validator compiled for it be reused
+_public_schema_cache = TTLCache(ttl=300, maxsize=256)
+
+# Reads the resource fields used in tool responses in one call
+_resource_fields = attrgetter("resource_name", "resource_type", "directory", "filename", "info")
+
+# Reads the flavor and version of a module in one call
+_module_fields = attrgetter("flavor", "version")
+
+# Info fields as (attribute name, JSON key). Info has only flat fields, so reading these directly gives
+# the same dict as Info.to_dict() without its generic recursive walk
+_INFO_FIELDS = tuple(Info.attribute_map.items())
+
+# Runs independent control plane lookups alongside a tool's main request
+_background_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="facets-lookup")
+
+# Warms the module cache after the catalog is listed; kept separate so prefetching never delays
+# the lookups a tool is waiting on
+_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="facets-prefetch")
+
+# Catalogs with more modules than this are not prefetched
+MAX_PREFETCHED_MODULES = 32
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj to indented JSON text."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 class ResourceInput(BaseModel):
     """Model for a single resource input connection."""
     resource_name: str = Field(..., description="Name of the resource to connect to")
@@ -59,6 +106,29 @@ class ResourceInput(BaseModel):
     output_name: Optional[str] = Field(default=None, description="Output name to use from the connected resource (optional, defaults to 'default')")
 
 
+class ResourceIdentifier(BaseModel):
+    """Model identifying a single resource in a project."""
+    resource_type: str = Field(..., description="Type of the resource (e.g., service, postgres)")
+    resource_name: str = Field(..., description="Name of the resource")
+
+
+class ResourceUpdate(BaseModel):
+    """Model for the new content of a single resource in a batched update."""
+    resource_type: str = Field(..., description="Type of the resource to update")
+    resource_name: str = Field(..., description="Name of the resource to update")
+    content: Dict[str, Any] = Field(..., description="The updated content for the resource")
+
+
+class NewResource(BaseModel):
+    """Model for a single resource to create in a batched add."""
+    resource_type: str = Field(..., description="Type of the resource to create")
+    resource_name: str = Field(..., description="Name of the resource to create")
+    flavor: str = Field(..., description="Flavor of the resource")
+    version: str = Field(..., description="Version of the resource")
+    content: Dict[str, Any] = Field(..., description="The content/configuration for the resource")
+    inputs: Optional[Dict[str, ResourceInput]] = Field(default=None, description="Input names mapped to the resources they connect to")
+
+
 class CompatibleResource(BaseModel):
     """Model for a compatible resource that can be used as an input."""
     output_name: str = Field(..., description="Name of the output from this resource")
@@ -75,6 +145,68 @@ class ModuleInputSpec(BaseModel):
     compatible_resources: List[CompatibleResource] = Field(default_factory=list, description="List of resources that can be used for this input")
 
 
+def _format_resource(resource, include_info: bool = True) -> Dict[str, Any]:
+    """
+    Format the identifying fields and info of a resource for tool responses.
+
+    Args:
+        resource: Resource returned by the control plane
+        include_info: If False, "info" is None and the Info model is not converted to a dict
+
+    Returns:
+        Dict with name, type, directory, filename and info of the resource
+    """
+    name, resource_type, directory, filename, info = _resource_fields(resource)
+    return {
+        "name": name,
+        "type": resource_type,  # This is the intent/resource type
+        "directory": directory,
+        "filename": filename,
+        "info": {attr: getattr(info, attr) for attr, _ in _INFO_FIELDS} if include_info and info else None
+    }
+
+
+def _format_raw_resource(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Format a resource from a raw API response the same way as _format_resource().
+
+    Args:
+        raw: Resource as decoded from the response JSON (camelCase keys)
+
+    Returns:
+        Dict with name, type, directory, filename and info of the resource
+    """
+    info = raw.get("info")
+    return {
+        "name": raw.get("resourceName"),
+        "type": raw.get("resourceType"),  # This is the intent/resource type
+        "directory": raw.get("directory"),
+        "filename": raw.get("filename"),
+        "info": {attr: info.get(json_key) for attr, json_key in _INFO_FIELDS} if info else None
+    }
+
+
+def _is_excluded_resource(raw: Dict[str, Any]) -> bool:
+    """
+    Check whether a resource should be hidden from resource listings.
+
+    Resources without a directory and base resources (info.ui.base_resource) are excluded.
+
+    Args:
+        raw: Resource as decoded from the response JSON (camelCase keys)
+
+    Returns:
+        True if the resource should be excluded
+    """
+    if not raw.get("directory"):
+        return True
+
+    # Check if info.ui.base_resource exists and is True; a ui value that isn't a dict doesn't exclude
+    info = raw.get("info")
+    ui = info.get("ui") if info else None
+    return isinstance(ui, dict) and bool(ui.get("base_resource"))
+
+
 @mcp.tool()
 def get_all_resources_by_project(
     limit: Annotated[int, "Maximum number of resources to return (default: 50)"] = 50,
@@ -108,7 +240,7 @@ def get_all_resources_by_project(
     Raises:
         McpError: If project cannot be resolved
     """
-    api_instance = swagger_client.UiDropdownsControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiDropdownsControllerApi)
 
     # Resolve project
     try:
@@ -123,54 +255,41 @@ def get_all_resources_by_project(
     project_name_resolved = current_project.name
 
     try:
-        # Call the API to get all resources for the project
-        resources = api_instance.get_all_resources_by_stack(project_name_resolved, include_content=True)
-
-        # Extract and transform the relevant information
-        all_resources = []
-        for resource in resources:
-            # Check if resource should be excluded
-            should_exclude = False
+        # Call the API to get all resources for the project. Only a few fields of each resource are
+        # used, so decode the raw body instead of building the full swagger models (edges, errors, ...)
+        response = api_instance.get_all_resources_by_stack(
+            project_name_resolved, include_content=True, _preload_content=False
+        )
+        try:
+            resources = orjson.loads(response.data)
+        finally:
+            response.release_conn()
 
-            # Safely check if resource.info.ui.base_resource exists and is True
-            try:
-                if not resource.directory:
-                    should_exclude = True
-                if resource.info and resource.info.ui and resource.info.ui.get("base_resource"):
-                    should_exclude = True
-            except AttributeError:
-                # If any attribute is missing along the path, don't exclude
-                pass
-
-            # Only include resources that shouldn't be excluded
-            if not should_exclude:
-                resource_data = {
-                    "name": resource.resource_name,
-                    "type": resource.resource_type,  # This is the intent/resource type
-                    "directory": resource.directory,
-                    "filename": resource.filename,
-                    "info": resource.info.to_dict() if resource.info else None
-                }
-                all_resources.append(resource_data)
+        # Skip excluded resources and apply filters on the raw resources. This is a lazy pipeline,
+        # so that only the resources on the requested page are formatted and kept
+        filtered_resources = (raw for raw in resources if not _is_excluded_resource(raw))
 
         # Apply filters
-        filtered_resources = all_resources
         filters_applied = {}
 
         if resource_type:
-            filtered_resources = [r for r in filtered_resources if r["type"] == resource_type]
+            filtered_resources = (r for r in filtered_resources if r.get("resourceType") == resource_type)
             filters_applied["resource_type"] = resource_type
 
         if search:
             search_lower = search.lower()
-            filtered_resources = [r for r in filtered_resources if search_lower in r["name"].lower()]
+            filtered_resources = (r for r in filtered_resources if search_lower in r.get("resourceName").lower())
             filters_applied["search"] = search
 
-        # Calculate pagination
-        total_count = len(filtered_resources)
+        # Calculate pagination while counting all matches
         start_idx = offset
         end_idx = offset + limit
-        paginated_resources = filtered_resources[start_idx:end_idx]
+        paginated_resources = []
+        total_count = 0
+        for raw in filtered_resources:
+            if start_idx <= total_count < end_idx:
+                paginated_resources.append(_format_raw_resource(raw))
+            total_count += 1
         has_more = end_idx < total_count
 
         return {
@@ -185,6 +304,8 @@ def get_all_resources_by_project(
             "filters_applied": filters_applied if filters_applied else None
         }
 
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -192,11 +313,92 @@ def get_all_resources_by_project(
                 code=INVALID_REQUEST,
                 message=f"Failed to get resources for project '{project_name}': {error_message}"
             )
-        )
+        ) from e
+
+
+def _fetch_resource(project_name: str, resource_type: str, resource_name: str) -> Dict[str, Any]:
+    """
+    Fetch a single resource from the control plane and format it for tool responses.
+
+    Args:
+        project_name: Name of the project the resource belongs to
+        resource_type: The type of the resource
+        resource_name: The name of the resource
+
+    Returns:
+        Resource details including name, type, directory, filename, content, info and any errors
+    """
+    api_instance = ClientUtils.get_api(swagger_client.UiDropdownsControllerApi)
+
+    # Call the API directly with resource name, type, and project name
+    resource = api_instance.get_resource_by_stack(project_name, resource_type, resource_name)
+
+    return _format_fetched_resource(resource)
+
+
+def _format_fetched_resource(resource: Any, include_info: bool = True) -> Dict[str, Any]:
+    """
+    Format a single resource fetched from the control plane for tool responses.
+
+    Args:
+        resource: BlueprintFile returned by get_resource_by_stack
+        include_info: If False, the "info" field is left as None
+
+    Returns:
+        Resource details as returned by get_resource_by_project()
+    """
+    # Format the response
+    resource_data = _format_resource(resource, include_info)
+    resource_data["content"] = orjson.loads(resource.content) if resource.content else None
+    
+    # Add errors if any exist
+    if hasattr(resource, 'errors') and resource.errors:
+        errors = []
+        for error in resource.errors:
+            error_info = {
+                "message": error.message,
+                "category": error.category,
+                "severity": error.severity if hasattr(error, 'severity') else None
+            }
+            errors.append(error_info)
+        resource_data["errors"] = errors
+        
+        # Add suggestion for Invalid Reference Expression errors
+        if any(error.category == "Invalid Reference Expression" for error in resource.errors):
+            resource_data["suggestion"] = "Use get_resource_output_tree for the resource you're trying to reference."
+
+    return resource_data
+
+
+def _get_cached_resource(project_name: str, resource_type: str, resource_name: str,
+                         include_info: bool = True) -> Dict[str, Any]:
+    """
+    Get a formatted resource of a resolved project, served from the resource cache when possible.
+
+    The cache always holds the complete resource. Callers get their own copy, so changing the
+    result (e.g. editing "content" before an update) never alters the cached entry.
+
+    Args:
+        project_name: Name of the resolved project
+        resource_type: The type of the resource
+        resource_name: The name of the resource
+        include_info: If False, the "info" field is left as None
+
+    Returns:
+        Resource details as returned by get_resource_by_project()
+    """
+    resource_data = copy.deepcopy(_resource_cache.get_or_set(
+        (project_name, resource_type, resource_name),
+        lambda: _fetch_resource(project_name, resource_type, resource_name)
+    ))
+    if not include_info:
+        resource_data["info"] = None
+    return resource_data
 
 
 @mcp.tool()
-def get_resource_by_project(resource_type: str, resource_name: str, project_name: str = "") -> Dict[str, Any]:
+def get_resource_by_project(resource_type: str, resource_name: str, project_name: str = "",
+                            include_info: bool = True) -> Dict[str, Any]:
     """
         Get a specific resource by type and name for the current project.
 
@@ -211,6 +413,7 @@ def get_resource_by_project(resource_type: str, resource_name: str, project_name
             resource_type: The type of resource to retrieve (e.g., service, ingress, postgres, redis)
             resource_name: The name of the specific resource to retrieve
             project_name: Optional - Project name to use (overrides current project context)
+            include_info: Optional - Set to False if the "info" field (module flavour, version, etc.) is not needed
 
         Returns:
             Resource details including name, type, and current configuration in the "content" field
@@ -218,8 +421,6 @@ def get_resource_by_project(resource_type: str, resource_name: str, project_name
         Raises:
             McpError: If project cannot be resolved
     """
-    api_instance = swagger_client.UiDropdownsControllerApi(ClientUtils.get_client())
-
     # Resolve project
     try:
         current_project = ClientUtils.resolve_project(project_name)
@@ -233,38 +434,11 @@ def get_resource_by_project(resource_type: str, resource_name: str, project_name
     project_name_resolved = current_project.name
     
     try:
+        # Serve repeated reads (e.g. spec lookup followed by an update) from a short-lived cache
+        return _get_cached_resource(project_name_resolved, resource_type, resource_name, include_info)
 
-        # Call the API directly with resource name, type, and project name
-        resource = api_instance.get_resource_by_stack(project_name_resolved, resource_type, resource_name)
-
-        # Format the response
-        resource_data = {
-            "name": resource.resource_name,
-            "type": resource.resource_type,
-            "directory": resource.directory,
-            "filename": resource.filename,
-            "content": json.loads(resource.content) if resource.content else None,
-            "info": resource.info.to_dict() if resource.info else None  # Add the info object as a separate field
-        }
-        
-        # Add errors if any exist
-        if hasattr(resource, 'errors') and resource.errors:
-            errors = []
-            for error in resource.errors:
-                error_info = {
-                    "message": error.message,
-                    "category": error.category,
-                    "severity": error.severity if hasattr(error, 'severity') else None
-                }
-                errors.append(error_info)
-            resource_data["errors"] = errors
-            
-            # Add suggestion for Invalid Reference Expression errors
-            if any(error.category == "Invalid Reference Expression" for error in resource.errors):
-                resource_data["suggestion"] = "Use get_resource_output_tree for the resource you're trying to reference."
-
-        return resource_data
-
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -272,42 +446,34 @@ def get_resource_by_project(resource_type: str, resource_name: str, project_name
                 code=INVALID_REQUEST,
                 message=f"Failed to get resource '{resource_name}' of type '{resource_type}' for project '{project_name_resolved}': {error_message}"
             )
-        )
+        ) from e
 
 
 @mcp.tool()
-def get_spec_for_resource(resource_type: str, resource_name: str, project_name: str = "") -> Dict[str, Any]:
+def get_resources_by_project_bulk(resources: List[ResourceIdentifier], project_name: str = "") -> List[Dict[str, Any]]:
     """
-        Get specification details for the module mapped to a specific resource in the current project.
+    Get several resources by type and name from the current project in one call.
 
-        This returns the schema that defines valid fields, allowed values, and validation rules
-        ONLY for the "spec" part of the resource JSON. A complete resource JSON has other fields
-        such as kind, metadata, flavor, version, etc., which are not covered by this schema.
-
-        To understand the complete resource structure, refer to the sample JSON from
-        get_sample_for_module() which shows all required fields including those outside the "spec" section.
-
-        Use this spec before updating resources to understand the available configuration options
-        and requirements for the "spec" section specifically.
-
-        Note: If you find fields with annotations starting with "x-ui-" (e.g., x-ui-secret-ref, x-ui-output-type),
-        call explain_ui_annotation() with the annotation name to understand how to handle them properly.
+    Use this instead of calling get_resource_by_project() repeatedly when you need the
+    configuration of multiple resources. The resources are fetched concurrently and returned
+    in the same order as requested. A resource that cannot be fetched does not fail the whole
+    call; its entry contains an "error" field instead.
 
-        **Parameter Resolution Hierarchy:**
-        - project_name: If provided, uses this project; otherwise falls back to current project context
+    **Parameter Resolution Hierarchy:**
+    - project_name: If provided, uses this project; otherwise falls back to current project context
 
-        Args:
-            resource_type: The type of resource (e.g., service, ingress, postgres, redis)
-            resource_name: The name of the specific resource
-            project_name: Optional - Project name to use (overrides current project context)
+    Args:
+        resources: List of ResourceIdentifier objects with resource_type and resource_name
+        project_name: Optional - Project name to use (overrides current project context)
 
-        Returns:
-            A schema specification that describes valid fields and values for the "spec" section of this resource type
+    Returns:
+        List of resource details in the same format as get_resource_by_project(), or
+        {"name", "type", "error"} entries for resources that could not be fetched
 
-        Raises:
-            McpError: If project cannot be resolved
+    Raises:
+        McpError: If project cannot be resolved
     """
-    # First, get the resource details to extract intent, flavor, and version
+    # Resolve project
     try:
         current_project = ClientUtils.resolve_project(project_name)
     except ValueError as ve:
@@ -317,11 +483,92 @@ def get_spec_for_resource(resource_type: str, resource_name: str, project_name:
                 message=str(ve)
             )
         )
+    project_name_resolved = current_project.name
+
+    def fetch(resource: ResourceIdentifier) -> Dict[str, Any]:
+        try:
+            return _get_cached_resource(project_name_resolved, resource.resource_type, resource.resource_name)
+        except Exception as e:
+            return {
+                "name": resource.resource_name,
+                "type": resource.resource_type,
+                "error": ClientUtils.extract_error_message(e)
+            }
+
+    return list(_background_executor.map(fetch, resources))
+
+
+def _get_module_definition(intent: str, flavor: str, version: str,
+                           project_name: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Get the parsed spec and sample JSON of a module, served from a cache when fetched recently.
+
+    Both come from the same API call, so they are parsed and cached together.
+
+    Args:
+        intent: The intent/resource type of the module
+        flavor: The flavor of the module
+        version: The version of the module
+        project_name: Name of the project the module is looked up for
+
+    Returns:
+        Tuple of (spec, sample); either is None if the module does not define it
+    """
+    def fetch_module() -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        # Call the TF Module API to get the module
+        api_instance = ClientUtils.get_api(swagger_client.ModuleManagementApi)
+        module_response = api_instance.get_module_for_ifv_and_stack(
+            flavor=flavor,
+            intent=intent,
+            stack_name=project_name,
+            version=version
+        )
+        spec = orjson.loads(module_response.spec) if module_response.spec else None
+        sample = orjson.loads(module_response.sample_json) if module_response.sample_json else None
+        return spec, sample
 
-    try:
+    return _module_cache.get_or_set((intent, flavor, version, project_name), fetch_module)
+
+
+def _get_module_spec(intent: str, flavor: str, version: str, project_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the parsed spec of a module.
+
+    Args:
+        intent: The intent/resource type of the module
+        flavor: The flavor of the module
+        version: The version of the module
+        project_name: Name of the project the module is looked up for
+
+    Returns:
+        The spec as a dictionary, or None if the module has no spec
+    """
+    spec, _ = _get_module_definition(intent, flavor, version, project_name)
+    return spec
+
+
+def _get_resource_spec(project_name: str, resource_type: str, resource_name: str,
+                       flavor: str = "", version: str = "") -> Dict[str, Any]:
+    """
+    Get the spec of the module a resource uses, for an already resolved project.
 
-        # Get the specific resource
-        resource = get_resource_by_project(resource_type, resource_name, project_name)
+    Args:
+        project_name: Name of the resolved project
+        resource_type: The type of the resource
+        resource_name: The name of the resource
+        flavor: Optional - Flavor of the resource's module; used with version to skip the resource lookup
+        version: Optional - Version of the resource's module; used with flavor to skip the resource lookup
+
+    Returns:
+        The spec of the resource's module
+
+    Raises:
+        McpError: If the resource has no flavor, version or spec
+    """
+    # The resource only needs to be fetched when the caller didn't supply flavor and version
+    if not (flavor and version):
+        # Get the specific resource, without resolving the project again
+        resource = _get_cached_resource(project_name, resource_type, resource_name)
 
         # Extract intent (resource_type), flavor, and version from info
         if not resource.get("info"):
@@ -339,96 +586,74 @@ def get_spec_for_resource(resource_type: str, resource_name: str, project_name:
         flavor = info.get("flavour")  # Note: flavour is the field name used in the Info model
         version = info.get("version")
 
-        # Validate required fields
-        if not flavor:
-            raise McpError(
-                ErrorData(
-                    code=INVALID_REQUEST,
-                    message=f"Resource '{resource_name}' of type '{resource_type}' does not have a flavor defined"
-                )
-            )
-        if not version:
-            raise McpError(
-                ErrorData(
-                    code=INVALID_REQUEST,
-                    message=f"Resource '{resource_name}' of type '{resource_type}' does not have a version defined"
-                )
+    # Validate required fields
+    if not flavor:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Resource '{resource_name}' of type '{resource_type}' does not have a flavor defined"
             )
-
-        # Now call the TF Module API to get the spec
-        api_instance = swagger_client.ModuleManagementApi(ClientUtils.get_client())
-        module_response = api_instance.get_module_for_ifv_and_stack(
-            flavor=flavor,
-            intent=resource_type,
-            stack_name=current_project.name,
-            version=version
         )
-
-        # Extract and parse the spec from the response
-        if not module_response.spec:
-            raise McpError(
-                ErrorData(
-                    code=INVALID_REQUEST,
-                    message=f"No specification found for resource '{resource_name}' of type '{resource_type}'"
-                )
+    if not version:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Resource '{resource_name}' of type '{resource_type}' does not have a version defined"
             )
+        )
 
-        # Return the spec as a JSON object
-        return json.loads(module_response.spec)
-
-    except Exception as e:
-        error_message = ClientUtils.extract_error_message(e)
+    # Now get the spec of the module the resource uses
+    spec = _get_module_spec(resource_type, flavor, version, project_name)
+    if spec is None:
         raise McpError(
             ErrorData(
                 code=INVALID_REQUEST,
-                message=f"Failed to get specification for resource '{resource_name}' of type '{resource_type}' in project '{current_project.name}': {error_message}"
+                message=f"No specification found for resource '{resource_name}' of type '{resource_type}'"
             )
         )
 
+    return spec
+
 
 @mcp.tool()
-def update_resource(resource_type: str, resource_name: str, content: Dict[str, Any], dry_run: bool = True, project_name: str = "") -> str:
+def get_spec_for_resource(resource_type: str, resource_name: str, project_name: str = "",
+                          flavor: str = "", version: str = "") -> Dict[str, Any]:
     """
-    Update a specific resource in the current project with strict schema validation.
+        Get specification details for the module mapped to a specific resource in the current project.
 
-    IMPORTANT: This is a potentially irreversible operation that modifies resources.
-    Always run with `dry_run=True` first to preview changes before committing them.
+        This returns the schema that defines valid fields, allowed values, and validation rules
+        ONLY for the "spec" part of the resource JSON. A complete resource JSON has other fields
+        such as kind, metadata, flavor, version, etc., which are not covered by this schema.
 
-    **Enhanced Schema Validation:**
-    This function now performs comprehensive validation using the organization's complete schema
-    from `get_resource_schema_public()` to ensure the updated configuration matches exact requirements
-    including all properties, types, constraints, and special annotations.
+        To understand the complete resource structure, refer to the sample JSON from
+        get_sample_for_module() which shows all required fields including those outside the "spec" section.
 
-    **Safe Update Workflow:**
-    1. **Preview Changes**: Always run with `dry_run=True` first
-    2. **Review Diff**: Examine the differences between current and proposed configuration
-    3. **User Confirmation**: ASK THE USER EXPLICITLY if they want to proceed
-    4. **Apply Changes**: Only if user confirms, run again with `dry_run=False`
+        Use this spec before updating resources to understand the available configuration options
+        and requirements for the "spec" section specifically.
 
-    **Schema-Driven Updates:**
-    Before updating, it's recommended to:
-    - Use `get_resource_by_project()` to see current configuration
-    - Use `get_resource_schema_public()` to understand valid properties and constraints
-    - Ensure your updates conform to the organization's schema requirements
+        Note: If you find fields with annotations starting with "x-ui-" (e.g., x-ui-secret-ref, x-ui-output-type),
+        call explain_ui_annotation() with the annotation name to understand how to handle them properly.
 
-    **Parameter Resolution Hierarchy:**
-    - project_name: If provided, uses this project; otherwise falls back to current project context
+        If you already know the resource's flavor and version (e.g. from the "info" field returned by
+        get_resource_by_project()), pass both to skip fetching the resource again.
 
-    Args:
-        resource_type: The type of resource to update (e.g., service, ingress, postgres)
-        resource_name: The name of the specific resource to update
-        content: The updated content for the resource as a dictionary. Must conform
-                to the organization's schema with all required fields and valid values.
-        dry_run: If True, only preview changes without making them. Default is True.
-        project_name: Optional - Project name to use (overrides current project context)
+        **Parameter Resolution Hierarchy:**
+        - project_name: If provided, uses this project; otherwise falls back to current project context
 
-    Returns:
-        Preview of changes with diff (if dry_run=True) or confirmation of update (if dry_run=False)
+        Args:
+            resource_type: The type of resource (e.g., service, ingress, postgres, redis)
+            resource_name: The name of the specific resource
+            project_name: Optional - Project name to use (overrides current project context)
+            flavor: Optional - Flavor of the resource's module; used with version to skip the resource lookup
+            version: Optional - Version of the resource's module; used with flavor to skip the resource lookup
 
-    Raises:
-        McpError: If the resource doesn't exist, validation fails, project cannot be resolved, or update fails
+        Returns:
+            A schema specification that describes valid fields and values for the "spec" section of this resource type
+
+        Raises:
+            McpError: If project cannot be resolved
     """
-    # Resolve project
+    # First, get the resource details to extract intent, flavor, and version
     try:
         current_project = ClientUtils.resolve_project(project_name)
     except ValueError as ve:
@@ -438,140 +663,298 @@ def update_resource(resource_type: str, resource_name: str, content: Dict[str, A
                 message=str(ve)
             )
         )
-    project_name_resolved = current_project.name
 
     try:
 
-        # First, get the current resource to obtain metadata and current content
-        current_resource = get_resource_by_project(resource_type, resource_name, project_name)
-        current_content = current_resource.get("content", {})
-        
-        # Create a ResourceFileRequest instance with the updated content
-        resource_request = ResourceFileRequest(
-            resource_name=resource_name,
-            resource_type=resource_type,
-            content=content,
-            directory=current_resource.get("directory"),
-            filename=current_resource.get("filename")
-        )
+        return _get_resource_spec(current_project.name, resource_type, resource_name, flavor, version)
 
-        # Validate the updated content against the organization's complete schema
-        # Get resource metadata to determine flavor and version for schema validation
-        current_resource_content = current_resource.get("content", {})
-        flavor = current_resource_content.get("flavor")
-        version = current_resource_content.get("version")
-        
-        if flavor and version:
+    except McpError:
+        raise
+    except Exception as e:
+        error_message = ClientUtils.extract_error_message(e)
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Failed to get specification for resource '{resource_name}' of type '{resource_type}' in project '{current_project.name}': {error_message}"
+            )
+        ) from e
+
+
+def _validate_resource_update(resource_type: str, resource_name: str, content: Dict[str, Any],
+                              current_content: Dict[str, Any], project_name: str) -> None:
+    """
+    Validate updated resource content against the organization's complete schema.
+
+    The schema is chosen by the flavor and version in the resource's current content. If those
+    cannot be determined, basic validation against the resource's spec is used instead.
+
+    Args:
+        resource_type: The type of the resource
+        resource_name: The name of the resource
+        content: The proposed content
+        current_content: The resource's current content
+        project_name: Name of the resolved project
+
+    Raises:
+        McpError: If the content does not match the schema
+    """
+    # Get resource metadata to determine flavor and version for schema validation
+    flavor = current_content.get("flavor")
+    version = current_content.get("version")
+
+    if flavor and version:
+        try:
+            # Get the complete schema from the public API
+            schema_response = get_resource_schema_public(resource_type, flavor, version)
+
+            # Perform strict JSON schema validation using the organization's schema
+            validate_resource_with_public_schema(content, schema_response)
+
+        except Exception as schema_error:
+            # Provide helpful error message with schema context
+            error_message = str(schema_error)
+
+            # Try to get schema summary for debugging context
             try:
-                # Get the complete schema from the public API 
                 schema_response = get_resource_schema_public(resource_type, flavor, version)
-                
-                # Perform strict JSON schema validation using the organization's schema
-                validate_resource_with_public_schema(content, schema_response)
-                
-            except Exception as schema_error:
-                # Provide helpful error message with schema context
-                error_message = str(schema_error)
-                
-                # Try to get schema summary for debugging context
-                try:
-                    schema_response = get_resource_schema_public(resource_type, flavor, version)
-                    schema_summary = get_schema_validation_summary(schema_response)
-                    error_message += f"\n\nSchema Requirements:\n{schema_summary}"
-                except Exception:
-                    pass  # Schema summary is helpful but not critical
-                
-                raise McpError(
-                    ErrorData(
-                        code=INVALID_REQUEST,
-                        message=f"Resource update validation failed: {error_message}"
-                    )
+                schema_summary = get_schema_validation_summary(schema_response)
+                error_message += f"\n\nSchema Requirements:\n{schema_summary}"
+            except Exception:
+                pass  # Schema summary is helpful but not critical
+
+            raise McpError(
+                ErrorData(
+                    code=INVALID_REQUEST,
+                    message=f"Resource update validation failed: {error_message}"
+                )
+            )
+    else:
+        # Fallback to basic validation if flavor/version cannot be determined
+        resource_data = {
+            "name": resource_name,
+            "type": resource_type,
+            "content": content
+        }
+        try:
+            resource_spec_schema = _get_resource_spec(project_name, resource_type, resource_name)
+        except Exception:
+            resource_spec_schema = {}
+
+        validate_resource(resource_data, resource_spec_schema)
+
+
+def _content_diff(resource_type: str, resource_name: str, current_content: Dict[str, Any],
+                  new_content: Dict[str, Any]) -> str:
+    """
+    Build a unified diff between the current and proposed content of a resource.
+
+    Args:
+        resource_type: The type of the resource
+        resource_name: The name of the resource
+        current_content: The resource's current content
+        new_content: The proposed content
+
+    Returns:
+        The diff as a single string
+    """
+    import difflib
+
+    # Format the current and new content for comparison
+    current_json = _dumps(current_content).splitlines()
+    new_json = _dumps(new_content).splitlines()
+
+    # Generate a diff between current and new content
+    diff = difflib.unified_diff(
+        current_json,
+        new_json,
+        fromfile=f"{resource_type}/{resource_name} (current)",
+        tofile=f"{resource_type}/{resource_name} (proposed)",
+        lineterm='',
+        n=3  # Context lines
+    )
+
+    # Format the diff for readability
+    return '\n'.join(diff)
+
+
+def _get_update_result(project_name: str, resource_type: str, resource_name: str,
+                       created: bool = False) -> Dict[str, Any]:
+    """
+    Fetch a resource after it was updated or created and report any validation errors it now has.
+
+    The fetched resource also replaces the resource's entry in the resource cache.
+
+    Args:
+        project_name: Name of the project
+        resource_type: The type of the updated resource
+        resource_name: The name of the updated resource
+        created: True if the resource was just created rather than updated
+
+    Returns:
+        Dict with a success message, plus errors, warning and suggestion if the resource has errors
+    """
+    resource_data = _fetch_resource(project_name, resource_type, resource_name)
+
+    # Keep the fresh resource, so a follow-up read or update of it needs no extra request
+    _resource_cache.set((project_name, resource_type, resource_name), resource_data)
+
+    update_result = {
+        "message": f"Successfully {'created' if created else 'updated'} resource '{resource_name}' of type '{resource_type}'."
+    }
+
+    # Add errors if any, as already formatted for the resource
+    if resource_data.get("errors"):
+        update_result["errors"] = resource_data["errors"]
+        update_result["warning"] = f"Resource was {'added' if created else 'updated'} but has validation errors that need to be fixed."
+        if "suggestion" in resource_data:
+            update_result["suggestion"] = resource_data["suggestion"]
+
+    return update_result
+
+
+def _update_resources(project_name: str, updates: List[ResourceUpdate], dry_run: bool) -> List[Dict[str, Any]]:
+    """
+    Validate updates to resources of a resolved project and, unless dry_run, apply them in one request.
+
+    Shared by update_resource() and update_resources(). Every update is validated before anything
+    is changed.
+
+    Args:
+        project_name: Name of the resolved project
+        updates: The resources to update with their new content
+        dry_run: If True, only build a diff per resource without updating anything
+
+    Returns:
+        Per update, in order: {"resource_type", "resource_name", "diff"} if dry_run, otherwise the
+        result of _get_update_result()
+
+    Raises:
+        McpError: If validation fails for any resource
+    """
+    # Start the branch lookup now so it overlaps with fetching and validating the resources
+    branch_future = None if dry_run else _background_executor.submit(ClientUtils.get_project_branch, project_name)
+
+    # Get the current resources concurrently to obtain metadata and current content
+    current_resources = list(_background_executor.map(
+        lambda update: _get_cached_resource(
+            project_name, update.resource_type, update.resource_name, include_info=False
+        ),
+        updates
+    ))
+
+    # Validate every resource before anything is changed
+    for update, current_resource in zip(updates, current_resources):
+        _validate_resource_update(
+            update.resource_type, update.resource_name, update.content,
+            current_resource.get("content", {}), project_name
+        )
+
+    if dry_run:
+        return [
+            {
+                "resource_type": update.resource_type,
+                "resource_name": update.resource_name,
+                "diff": _content_diff(
+                    update.resource_type, update.resource_name,
+                    current_resource.get("content", {}), update.content
                 )
-        else:
-            # Fallback to basic validation if flavor/version cannot be determined
-            resource_data = {
-                "name": resource_name,
-                "type": resource_type,
-                "content": content
             }
-            try:
-                resource_spec_schema = get_spec_for_resource(resource_type, resource_name, project_name)
-            except Exception:
-                resource_spec_schema = {}
-            
-            validate_resource(resource_data, resource_spec_schema)
+            for update, current_resource in zip(updates, current_resources)
+        ]
+
+    # Submit all changes in a single request
+    update_request = UpdateBlueprintRequest(files=[
+        ResourceFileRequest(
+            resource_name=update.resource_name,
+            resource_type=update.resource_type,
+            content=update.content,
+            directory=current_resource.get("directory"),
+            filename=current_resource.get("filename")
+        )
+        for update, current_resource in zip(updates, current_resources)
+    ])
+    api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
+    api_instance.update_resources(update_request, project_name, branch_future.result())
+    for update in updates:
+        _resource_cache.pop((project_name, update.resource_type, update.resource_name))
+
+    # Check every resource for errors after the update
+    return list(_background_executor.map(
+        lambda update: _get_update_result(project_name, update.resource_type, update.resource_name),
+        updates
+    ))
+
+
+@mcp.tool()
+def update_resource(resource_type: str, resource_name: str, content: Dict[str, Any], dry_run: bool = True, project_name: str = "") -> str:
+    """
+    Update a specific resource in the current project with strict schema validation.
+
+    IMPORTANT: This is a potentially irreversible operation that modifies resources.
+    Always run with `dry_run=True` first to preview changes before committing them.
+
+    **Enhanced Schema Validation:**
+    This function now performs comprehensive validation using the organization's complete schema
+    from `get_resource_schema_public()` to ensure the updated configuration matches exact requirements
+    including all properties, types, constraints, and special annotations.
+
+    **Safe Update Workflow:**
+    1. **Preview Changes**: Always run with `dry_run=True` first
+    2. **Review Diff**: Examine the differences between current and proposed configuration
+    3. **User Confirmation**: ASK THE USER EXPLICITLY if they want to proceed
+    4. **Apply Changes**: Only if user confirms, run again with `dry_run=False`
+
+    **Schema-Driven Updates:**
+    Before updating, it's recommended to:
+    - Use `get_resource_by_project()` to see current configuration
+    - Use `get_resource_schema_public()` to understand valid properties and constraints
+    - Ensure your updates conform to the organization's schema requirements
+
+    **Parameter Resolution Hierarchy:**
+    - project_name: If provided, uses this project; otherwise falls back to current project context
+
+    Args:
+        resource_type: The type of resource to update (e.g., service, ingress, postgres)
+        resource_name: The name of the specific resource to update
+        content: The updated content for the resource as a dictionary. Must conform
+                to the organization's schema with all required fields and valid values.
+        dry_run: If True, only preview changes without making them. Default is True.
+        project_name: Optional - Project name to use (overrides current project context)
+
+    Returns:
+        Preview of changes with diff (if dry_run=True) or confirmation of update (if dry_run=False)
 
-        # Get project branch
-        api_stack = swagger_client.UiStackControllerApi(ClientUtils.get_client())
-        stack = api_stack.get_stack(project_name_resolved)
-        branch = stack.branch if hasattr(stack, 'branch') and stack.branch else None
+    Raises:
+        McpError: If the resource doesn't exist, validation fails, project cannot be resolved, or update fails
+    """
+    # Resolve project
+    try:
+        current_project = ClientUtils.resolve_project(project_name)
+    except ValueError as ve:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=str(ve)
+            )
+        )
+    project_name_resolved = current_project.name
+
+    try:
+        update = ResourceUpdate(resource_type=resource_type, resource_name=resource_name, content=content)
+        result = _update_resources(project_name_resolved, [update], dry_run)[0]
 
         # If dry_run is True, show a preview of changes rather than applying them
         if dry_run:
-            import json
-            import difflib
-            
-            # Format the current and new content for comparison
-            current_json = json.dumps(current_content, indent=2).splitlines()
-            new_json = json.dumps(content, indent=2).splitlines()
-            
-            # Generate a diff between current and new content
-            diff = difflib.unified_diff(
-                current_json, 
-                new_json,
-                fromfile=f"{resource_type}/{resource_name} (current)",
-                tofile=f"{resource_type}/{resource_name} (proposed)",
-                lineterm='',
-                n=3  # Context lines
-            )
-            
-            # Format the diff for readability
-            formatted_diff = '\n'.join(list(diff))
-            
             # Create a structured response for the dry run
-            result = {
+            return _dumps({
                 "type": "dry_run",
-                "resource_type": resource_type,
-                "resource_name": resource_name,
-                "diff": formatted_diff,
+                **result,
                 "instructions": "Review the proposed changes above. ➕ Added lines, ➖ Removed lines, and unchanged lines for context. ASK THE USER EXPLICITLY if they want to proceed with these changes. Only if the user confirms, run the update_resource function again with dry_run=False."
-            }
-            
-            return json.dumps(result, indent=2)
-        else:
-            # Create an API instance and update the resource
-            api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
-            update_request = UpdateBlueprintRequest(files=[resource_request])
-            api_instance.update_resources(update_request, project_name_resolved, branch)
-
-            # Check for errors after the update
-            dropdown_api = swagger_client.UiDropdownsControllerApi(ClientUtils.get_client())
-            resource_response = dropdown_api.get_resource_by_stack(project_name_resolved, resource_type, resource_name)
-            
-            update_result = {
-                "message": f"Successfully updated resource '{resource_name}' of type '{resource_type}'."
-            }
-            
-            # Add errors if any
-            if hasattr(resource_response, 'errors') and resource_response.errors:
-                errors = []
-                for error in resource_response.errors:
-                    error_info = {
-                        "message": error.message,
-                        "category": error.category,
-                        "severity": error.severity if hasattr(error, 'severity') else None
-                    }
-                    errors.append(error_info)
-                
-                update_result["errors"] = errors
-                update_result["warning"] = "Resource was updated but has validation errors that need to be fixed."
-                
-                # If it's an Invalid Reference Expression, suggest checking outputs
-                if any(error.category == "Invalid Reference Expression" for error in resource_response.errors):
-                    update_result["suggestion"] = "Please call get_resource_output_tree for the resource you are trying to refer to."
-            
-            import json
-            return json.dumps(update_result, indent=2)
+            })
+
+        return _dumps(result)
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -579,8 +962,128 @@ def update_resource(resource_type: str, resource_name: str, content: Dict[str, A
                 code=INVALID_REQUEST,
                 message=f"Failed to update resource '{resource_name}' of type '{resource_type}' in project '{project_name}': {error_message}"
             )
+        ) from e
+
+
+@mcp.tool()
+def update_resources(updates: List[ResourceUpdate], dry_run: bool = True, project_name: str = "") -> str:
+    """
+    Update several resources in the current project in a single request, with strict schema validation.
+
+    IMPORTANT: This is a potentially irreversible operation that modifies resources.
+    Always run with `dry_run=True` first to preview changes before committing them.
+
+    Use this instead of calling update_resource() repeatedly when changing multiple resources.
+    Every resource is validated the same way as in update_resource(); if any of them fails
+    validation, nothing is updated. All changes are then submitted together in one request.
+
+    **Safe Update Workflow:**
+    1. **Preview Changes**: Always run with `dry_run=True` first
+    2. **Review Diff**: Examine the differences for every resource
+    3. **User Confirmation**: ASK THE USER EXPLICITLY if they want to proceed
+    4. **Apply Changes**: Only if user confirms, run again with `dry_run=False`
+
+    **Parameter Resolution Hierarchy:**
+    - project_name: If provided, uses this project; otherwise falls back to current project context
+
+    Args:
+        updates: List of ResourceUpdate objects with resource_type, resource_name and the updated content
+        dry_run: If True, only preview changes without making them. Default is True.
+        project_name: Optional - Project name to use (overrides current project context)
+
+    Returns:
+        Preview of changes with a diff per resource (if dry_run=True) or the result of
+        the update per resource (if dry_run=False)
+
+    Raises:
+        McpError: If a resource doesn't exist, validation fails, project cannot be resolved, or update fails
+    """
+    # Resolve project
+    try:
+        current_project = ClientUtils.resolve_project(project_name)
+    except ValueError as ve:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=str(ve)
+            )
+        )
+    project_name_resolved = current_project.name
+
+    if not updates:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message="At least one resource update must be provided."
+            )
+        )
+
+    try:
+        results = _update_resources(project_name_resolved, updates, dry_run)
+
+        if dry_run:
+            result = {
+                "type": "dry_run",
+                "changes": results,
+                "instructions": "Review the proposed changes above. ➕ Added lines, ➖ Removed lines, and unchanged lines for context. ASK THE USER EXPLICITLY if they want to proceed with these changes. Only if the user confirms, run the update_resources function again with dry_run=False."
+            }
+
+            return _dumps(result)
+
+        return _dumps({"results": results})
+    except McpError:
+        raise
+    except Exception as e:
+        error_message = ClientUtils.extract_error_message(e)
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Failed to update resources in project '{project_name_resolved}': {error_message}"
+            )
+        ) from e
+
+
+def _fetch_module_inputs(project_name: str, resource_type: str, flavor: str) -> Dict[str, ModuleInputSpec]:
+    """
+    Fetch and format the inputs of a module from the API.
+
+    Args:
+        project_name: Name of the resolved project
+        resource_type: The type of resource to create
+        flavor: The flavor of the resource to create
+
+    Returns:
+        A dictionary of input names to ModuleInputSpec objects, as returned by get_module_inputs()
+    """
+    api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
+
+    # Call the API to get module inputs
+    module_inputs = api_instance.get_module_inputs(project_name, resource_type, flavor)
+
+    # Format the response using Pydantic models
+    result = {}
+    for input_name, input_data in module_inputs.items():
+        # Extract compatible resources as Pydantic objects
+        compatible_resources = []
+        if input_data.compatible_resources:
+            for resource in input_data.compatible_resources:
+                compatible_resources.append(CompatibleResource(
+                    output_name=resource.output_name,
+                    resource_name=resource.resource_name,
+                    resource_type=resource.resource_type
+                ))
+
+        # Create ModuleInputSpec object
+        result[input_name] = ModuleInputSpec(
+            display_name=input_data.display_name,
+            description=input_data.description,
+            optional=input_data.optional,
+            type=input_data.type,
+            compatible_resources=compatible_resources
         )
 
+    return result
+
 
 @mcp.tool()
 def get_module_inputs(resource_type: str, flavor: str, project_name: str = "") -> Dict[str, ModuleInputSpec]:
@@ -636,37 +1139,14 @@ def get_module_inputs(resource_type: str, flavor: str, project_name: str = "") -
     project_name_resolved = current_project.name
     
     try:
+        # Inputs are looked up on every add_resource call, so serve repeated lookups from the cache
+        return _module_inputs_cache.get_or_set(
+            (project_name_resolved, resource_type, flavor),
+            lambda: _fetch_module_inputs(project_name_resolved, resource_type, flavor)
+        )
 
-        # Create an API instance
-        api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
-
-        # Call the API to get module inputs
-        module_inputs = api_instance.get_module_inputs(project_name_resolved, resource_type, flavor)
-
-        # Format the response using Pydantic models
-        result = {}
-        for input_name, input_data in module_inputs.items():
-            # Extract compatible resources as Pydantic objects
-            compatible_resources = []
-            if input_data.compatible_resources:
-                for resource in input_data.compatible_resources:
-                    compatible_resources.append(CompatibleResource(
-                        output_name=resource.output_name,
-                        resource_name=resource.resource_name,
-                        resource_type=resource.resource_type
-                    ))
-
-            # Create ModuleInputSpec object
-            result[input_name] = ModuleInputSpec(
-                display_name=input_data.display_name,
-                description=input_data.description,
-                optional=input_data.optional,
-                type=input_data.type,
-                compatible_resources=compatible_resources
-            )
-
-        return result
-
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -674,7 +1154,285 @@ def get_module_inputs(resource_type: str, flavor: str, project_name: str = "") -
                 code=INVALID_REQUEST,
                 message=f"Failed to get module inputs for resource type '{resource_type}' with flavor '{flavor}' in project '{project_name_resolved}': {error_message}"
             )
+        ) from e
+
+
+def _build_new_resource_request(project_name: str, resource_type: str, resource_name: str, flavor: str,
+                                version: str, content: Optional[Dict[str, Any]],
+                                inputs: Optional[Dict[str, ResourceInput]]) -> ResourceFileRequest:
+    """
+    Validate a new resource and build the request that creates it.
+
+    Checks that flavor, version and content are given, that the inputs satisfy the module's
+    requirements, and that the content (with the inputs added) matches the organization's schema.
+
+    Args:
+        project_name: Name of the resolved project
+        resource_type: The type of resource to create
+        resource_name: The name of the new resource
+        flavor: The flavor of the resource
+        version: The version of the resource
+        content: The content/configuration for the resource
+        inputs: Input names mapped to the resources they connect to, if any
+
+    Returns:
+        The ResourceFileRequest for the new resource, with the inputs included in its content
+
+    Raises:
+        McpError: If a required parameter is missing or validation fails
+    """
+    # If flavor is not provided, prompt the user
+    if not flavor:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Flavor must be specified for creating a new resource of type '{resource_type}'. "
+                         "Please provide a flavor parameter."
+            )
+        )
+
+    # If version is not provided, prompt the user
+    if not version:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Version must be specified for creating a new resource of type '{resource_type}'. "
+                         "Please provide a version parameter."
+            )
+        )
+
+    # Check if content is provided
+    if not content:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Content must be specified for creating a new resource of type '{resource_type}'. "
+                         "First use get_sample_for_module() to get a template, then customize it."
+            )
+        )
+
+    # Always validate inputs - get module requirements first
+    module_inputs = get_module_inputs(resource_type, flavor, project_name)
+
+    # Check for required inputs without any compatible resources
+    required_without_compatible = [
+        input_name for input_name, input_spec in module_inputs.items()
+        if not input_spec.optional and not input_spec.compatible_resources
+    ]
+
+    # If there are required inputs without compatible resources, block creation
+    if required_without_compatible:
+        missing_deps_list = []
+        for input_name in required_without_compatible:
+            input_spec = module_inputs[input_name]
+            missing_deps_list.append(f"'{input_name}' ({input_spec.display_name})")
+
+        missing_deps = ", ".join(missing_deps_list)
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Cannot create resource '{resource_type}' because the following required inputs have no compatible resources available: {missing_deps}. "
+                        f"You need to create the required dependency resources first. "
+                        f"Use list_available_resources() to see what resources you can create."
+            )
+        )
+
+    # Get required inputs that have compatible resources available
+    required_inputs = [input_name for input_name, input_spec in module_inputs.items()
+                      if not input_spec.optional and input_spec.compatible_resources]
+
+    # Check if inputs is None but required inputs exist
+    if inputs is None:
+        if required_inputs:
+            input_list = ", ".join(required_inputs)
+            raise McpError(
+                ErrorData(
+                    code=INVALID_REQUEST,
+                    message=f"Inputs must be specified for creating a resource of type '{resource_type}'. "
+                             f"The following inputs are required: {input_list}. "
+                             f"Call get_module_inputs('{resource_type}', '{flavor}') "
+                             f"to see all required inputs and their compatible resources."
+                )
+            )
+    else:
+        # Validate provided inputs
+        provided_inputs = set(inputs.keys()) if inputs else set()
+        required_input_set = set(required_inputs)
+
+        # Check for missing required inputs
+        missing_inputs = required_input_set - provided_inputs
+        if missing_inputs:
+            missing_list = ", ".join(sorted(missing_inputs))
+            raise McpError(
+                ErrorData(
+                    code=INVALID_REQUEST,
+                    message=f"Missing required inputs for resource type '{resource_type}': {missing_list}. "
+                             f"Call get_module_inputs('{resource_type}', '{flavor}') "
+                             f"to see all required inputs and their compatible resources."
+                )
+            )
+
+        # Check for invalid input names (inputs not defined in module)
+        valid_input_names = set(module_inputs.keys())
+        invalid_inputs = provided_inputs - valid_input_names
+        if invalid_inputs:
+            invalid_list = ", ".join(sorted(invalid_inputs))
+            valid_list = ", ".join(sorted(valid_input_names))
+            raise McpError(
+                ErrorData(
+                    code=INVALID_REQUEST,
+                    message=f"Invalid input names for resource type '{resource_type}': {invalid_list}. "
+                             f"Valid input names are: {valid_list}."
+                )
+            )
+
+        # Validate compatibility of provided resources
+        for input_name, input_value in inputs.items():
+            input_spec = module_inputs[input_name]
+            compatible_resources = input_spec.compatible_resources
+
+            # Find if the provided resource is compatible
+            is_compatible = False
+            for compatible_resource in compatible_resources:
+                if (compatible_resource.resource_name == input_value.resource_name and
+                    compatible_resource.resource_type == input_value.resource_type):
+                    # Check if output_name matches (if specified)
+                    if input_value.output_name is None or input_value.output_name == compatible_resource.output_name:
+                        is_compatible = True
+                        break
+
+            if not is_compatible:
+                compatible_list = []
+                for cr in compatible_resources:
+                    compatible_list.append(f"{cr.resource_type}/{cr.resource_name} (output: {cr.output_name})")
+                compatible_str = ", ".join(compatible_list) if compatible_list else "none available"
+
+                raise McpError(
+                    ErrorData(
+                        code=INVALID_REQUEST,
+                        message=f"Resource '{input_value.resource_type}/{input_value.resource_name}' "
+                                 f"(output: {input_value.output_name or 'default'}) is not compatible with input '{input_name}'. "
+                                 f"Compatible resources are: {compatible_str}."
+                    )
+                )
+
+    # If inputs are provided, add them to the content dictionary
+    if inputs:
+        # Format the inputs for the content dictionary
+        formatted_inputs = {}
+        for input_name, input_value in inputs.items():
+            # Create input entry without output_name first
+            input_entry = {
+                "resource_name": input_value.resource_name,
+                "resource_type": input_value.resource_type
+            }
+
+            # Only add output_name if it's provided and not 'default'
+            if input_value.output_name is not None and input_value.output_name != 'default':
+                input_entry["output_name"] = input_value.output_name
+
+            formatted_inputs[input_name] = input_entry
+
+        # Build the content with the inputs in one step, leaving the caller's dictionary unmodified
+        content = {**content, "inputs": formatted_inputs} if content else {"inputs": formatted_inputs}
+
+    # Create a ResourceFileRequest instance with the resource details (after inputs are processed)
+    resource_request = ResourceFileRequest(
+        resource_name=resource_name,
+        resource_type=resource_type,
+        content=content,
+        flavor=flavor
+    )
+
+    # Directory and filename will be determined by the server
+
+    # Validate the resource content against the organization's complete schema
+    try:
+        # Get the complete schema from the public API 
+        schema_response = get_resource_schema_public(resource_type, flavor, version)
+        
+        # Perform strict JSON schema validation using the organization's schema
+        validate_resource_with_public_schema(content, schema_response)
+        
+    except Exception as schema_error:
+        # Provide helpful error message with schema context
+        error_message = str(schema_error)
+        
+        # Try to get schema summary for debugging context
+        try:
+            schema_response = get_resource_schema_public(resource_type, flavor, version)
+            schema_summary = get_schema_validation_summary(schema_response)
+            error_message += f"\n\nSchema Requirements:\n{schema_summary}"
+        except Exception:
+            pass  # Schema summary is helpful but not critical
+        
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Resource configuration validation failed: {error_message}"
+            )
+        )
+
+    return resource_request
+
+
+def _add_resources(project_name: str, resources: List[NewResource], dry_run: bool) -> List[Dict[str, Any]]:
+    """
+    Validate new resources for a resolved project and, unless dry_run, create them in one request.
+
+    Shared by add_resource() and add_resources(). Every resource is validated before anything
+    is created.
+
+    Args:
+        project_name: Name of the resolved project
+        resources: The resources to create
+        dry_run: If True, only build a preview per resource without creating anything
+
+    Returns:
+        Per resource, in order: {"resource_type", "resource_name", "flavor", "version", "content_preview"}
+        if dry_run, otherwise the result of _get_update_result()
+
+    Raises:
+        McpError: If a required parameter is missing or validation fails for any resource
+    """
+    # Start the branch lookup now so it overlaps with validating the resources
+    branch_future = None if dry_run else _background_executor.submit(ClientUtils.get_project_branch, project_name)
+
+    # Validate every resource before anything is created
+    resource_requests = [
+        _build_new_resource_request(
+            project_name, resource.resource_type, resource.resource_name,
+            resource.flavor, resource.version, resource.content, resource.inputs
         )
+        for resource in resources
+    ]
+
+    if dry_run:
+        return [
+            {
+                "resource_type": resource.resource_type,
+                "resource_name": resource.resource_name,
+                "flavor": resource.flavor,
+                "version": resource.version,
+                "content_preview": _dumps(resource_request.content)
+            }
+            for resource, resource_request in zip(resources, resource_requests)
+        ]
+
+    # Create all resources in a single request
+    api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
+    api_instance.create_resources(resource_requests, project_name, branch_future.result())
+    for resource in resources:
+        _resource_cache.pop((project_name, resource.resource_type, resource.resource_name))
+    _module_inputs_cache.clear()
+
+    # Check every resource for errors after the addition
+    return list(_background_executor.map(
+        lambda resource: _get_update_result(
+            project_name, resource.resource_type, resource.resource_name, created=True
+        ),
+        resources
+    ))
 
 
 @mcp.tool()
@@ -705,6 +1463,7 @@ def add_resource(resource_type: str, resource_name: str, flavor: str, version: s
     1. **Schema Understanding**: Use `get_resource_schema_public()` to understand the organization's schema
     2. **Input Dependencies**: Call `get_module_inputs()` to check required resource connections
     3. **Template Structure**: Use `get_sample_for_module()` to see proper configuration structure
+    Tip: `get_module_details()` returns the spec, sample and inputs of a module in a single call.
     
     **Complete Resource Creation Workflow:**
     1. **Discover Resources**: `list_available_resources()` to see available types and flavors
@@ -768,281 +1527,192 @@ def add_resource(resource_type: str, resource_name: str, flavor: str, version: s
     project_name_resolved = current_project.name
     
     try:
+        new_resource = NewResource(
+            resource_type=resource_type,
+            resource_name=resource_name,
+            flavor=flavor,
+            version=version,
+            content=content or {},
+            inputs=inputs
+        )
+        result = _add_resources(project_name_resolved, [new_resource], dry_run)[0]
 
-        # If flavor is not provided, prompt the user
-        if not flavor:
-            raise McpError(
-                ErrorData(
-                    code=INVALID_REQUEST,
-                    message=f"Flavor must be specified for creating a new resource of type '{resource_type}'. "
-                             "Please provide a flavor parameter."
-                )
-            )
-
-        # If version is not provided, prompt the user
-        if not version:
-            raise McpError(
-                ErrorData(
-                    code=INVALID_REQUEST,
-                    message=f"Version must be specified for creating a new resource of type '{resource_type}'. "
-                             "Please provide a version parameter."
-                )
-            )
-
-        # Check if content is provided
-        if not content:
-            raise McpError(
-                ErrorData(
-                    code=INVALID_REQUEST,
-                    message=f"Content must be specified for creating a new resource of type '{resource_type}'. "
-                             "First use get_sample_for_module() to get a template, then customize it."
-                )
-            )
-
-        # Always validate inputs - get module requirements first
-        module_inputs = get_module_inputs(resource_type, flavor, project_name)
+        # If dry_run is True, show a preview of the resource rather than creating it
+        if dry_run:
+            # Display information about inputs if they exist
+            inputs_info = ""
+            if inputs:
+                inputs_lines = ["\nConnections to other resources:\n"]
+                for input_name, input_data in inputs.items():
+                    input_resource = f"{input_data.resource_type}/{input_data.resource_name}"
+                    output_name = input_data.output_name or 'default'
+                    inputs_lines.append(f"  - {input_name}: Connected to {input_resource} (output: {output_name})\n")
+                inputs_info = "".join(inputs_lines)
 
-        # Check for required inputs without any compatible resources
-        required_without_compatible = [
-            input_name for input_name, input_spec in module_inputs.items()
-            if not input_spec.optional and not input_spec.compatible_resources
-        ]
+            # Create a structured response for the dry run
+            return _dumps({
+                "type": "dry_run",
+                **result,
+                "inputs_preview": inputs_info,
+                "instructions": "THIS IS A IRREVERSIBLE CRITICAL OPERATION, CONFIRM WITH USER if they want to proceed with creating this resource OR ANY CHANGES ARE NEEDED. Only if the user confirms, run the add_resource function again with dry_run=False."
+            })
 
-        # If there are required inputs without compatible resources, block creation
-        if required_without_compatible:
-            missing_deps_list = []
-            for input_name in required_without_compatible:
-                input_spec = module_inputs[input_name]
-                missing_deps_list.append(f"'{input_name}' ({input_spec.display_name})")
+        return _dumps(result)
 
-            missing_deps = ", ".join(missing_deps_list)
-            raise McpError(
-                ErrorData(
-                    code=INVALID_REQUEST,
-                    message=f"Cannot create resource '{resource_type}' because the following required inputs have no compatible resources available: {missing_deps}. "
-                            f"You need to create the required dependency resources first. "
-                            f"Use list_available_resources() to see what resources you can create."
-                )
+    except McpError:
+        raise
+    except Exception as e:
+        error_message = ClientUtils.extract_error_message(e)
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Failed to add resource '{resource_name}' of type '{resource_type}' to project '{project_name_resolved}': {error_message}"
             )
+        ) from e
 
-        # Get required inputs that have compatible resources available
-        required_inputs = [input_name for input_name, input_spec in module_inputs.items()
-                          if not input_spec.optional and input_spec.compatible_resources]
 
-        # Check if inputs is None but required inputs exist
-        if inputs is None:
-            if required_inputs:
-                input_list = ", ".join(required_inputs)
-                raise McpError(
-                    ErrorData(
-                        code=INVALID_REQUEST,
-                        message=f"Inputs must be specified for creating a resource of type '{resource_type}'. "
-                                 f"The following inputs are required: {input_list}. "
-                                 f"Call get_module_inputs('{resource_type}', '{flavor}') "
-                                 f"to see all required inputs and their compatible resources."
-                    )
-                )
-        else:
-            # Validate provided inputs
-            provided_inputs = set(inputs.keys()) if inputs else set()
-            required_input_set = set(required_inputs)
-
-            # Check for missing required inputs
-            missing_inputs = required_input_set - provided_inputs
-            if missing_inputs:
-                missing_list = ", ".join(sorted(missing_inputs))
-                raise McpError(
-                    ErrorData(
-                        code=INVALID_REQUEST,
-                        message=f"Missing required inputs for resource type '{resource_type}': {missing_list}. "
-                                 f"Call get_module_inputs('{resource_type}', '{flavor}') "
-                                 f"to see all required inputs and their compatible resources."
-                    )
-                )
-
-            # Check for invalid input names (inputs not defined in module)
-            valid_input_names = set(module_inputs.keys())
-            invalid_inputs = provided_inputs - valid_input_names
-            if invalid_inputs:
-                invalid_list = ", ".join(sorted(invalid_inputs))
-                valid_list = ", ".join(sorted(valid_input_names))
-                raise McpError(
-                    ErrorData(
-                        code=INVALID_REQUEST,
-                        message=f"Invalid input names for resource type '{resource_type}': {invalid_list}. "
-                                 f"Valid input names are: {valid_list}."
-                    )
-                )
-
-            # Validate compatibility of provided resources
-            for input_name, input_value in inputs.items():
-                input_spec = module_inputs[input_name]
-                compatible_resources = input_spec.compatible_resources
-
-                # Find if the provided resource is compatible
-                is_compatible = False
-                for compatible_resource in compatible_resources:
-                    if (compatible_resource.resource_name == input_value.resource_name and
-                        compatible_resource.resource_type == input_value.resource_type):
-                        # Check if output_name matches (if specified)
-                        if input_value.output_name is None or input_value.output_name == compatible_resource.output_name:
-                            is_compatible = True
-                            break
-
-                if not is_compatible:
-                    compatible_list = []
-                    for cr in compatible_resources:
-                        compatible_list.append(f"{cr.resource_type}/{cr.resource_name} (output: {cr.output_name})")
-                    compatible_str = ", ".join(compatible_list) if compatible_list else "none available"
-
-                    raise McpError(
-                        ErrorData(
-                            code=INVALID_REQUEST,
-                            message=f"Resource '{input_value.resource_type}/{input_value.resource_name}' "
-                                     f"(output: {input_value.output_name or 'default'}) is not compatible with input '{input_name}'. "
-                                     f"Compatible resources are: {compatible_str}."
-                        )
-                    )
+@mcp.tool()
+def add_resources(resources: List[NewResource], dry_run: bool = True, project_name: str = "") -> str:
+    """
+    Add several new resources to the current project in a single request.
 
-        # If inputs are provided, add them to the content dictionary
-        if inputs:
-            # Create a copy of the content to avoid modifying the original
-            if content is None:
-                content = {}
-            else:
-                content = dict(content)  # Create a shallow copy
-
-            # Add inputs to the content dictionary
-            formatted_inputs = {}
-            for input_name, input_value in inputs.items():
-                # Create input entry without output_name first
-                input_entry = {
-                    "resource_name": input_value.resource_name,
-                    "resource_type": input_value.resource_type
-                }
+    IMPORTANT: This is a potentially irreversible operation that creates new resources.
+    Always run with `dry_run=True` first to preview the resources before creating them.
 
-                # Only add output_name if it's provided and not 'default'
-                if input_value.output_name is not None and input_value.output_name != 'default':
-                    input_entry["output_name"] = input_value.output_name
+    Use this instead of calling add_resource() repeatedly when creating multiple resources.
+    Every resource goes through the same checks as in add_resource() - module inputs and the
+    organization's schema - and if any of them fails, nothing is created. Follow the same
+    workflow as for add_resource(): call get_module_inputs() for each resource and ASK THE USER
+    to choose between compatible resources for required inputs.
 
-                formatted_inputs[input_name] = input_entry
+    Steps for safe resource creation:
+    1. Always run with `dry_run=True` first to preview the resource configurations.
+    2. Review the proposed resource configurations.
+    3. ASK THE USER EXPLICITLY if they want to proceed with creating these resources.
+    4. Only if user confirms, run again with `dry_run=False` to create the resources.
 
-            # Add the inputs to the content dictionary
-            content["inputs"] = formatted_inputs
+    **Parameter Resolution Hierarchy:**
+    - project_name: If provided, uses this project; otherwise falls back to current project context
 
-        # Create a ResourceFileRequest instance with the resource details (after inputs are processed)
-        resource_request = ResourceFileRequest(
-            resource_name=resource_name,
-            resource_type=resource_type,
-            content=content,
-            flavor=flavor
-        )
+    Args:
+        resources: List of NewResource objects with resource_type, resource_name, flavor, version,
+                   content and optional inputs
+        dry_run: If True, only preview the resources without creating them. Default is True.
+        project_name: Optional - Project name to use (overrides current project context)
 
-        # Directory and filename will be determined by the server
+    Returns:
+        Preview of the resources (if dry_run=True) or the result of the creation per resource (if dry_run=False)
 
-        # Validate the resource content against the organization's complete schema
-        try:
-            # Get the complete schema from the public API 
-            schema_response = get_resource_schema_public(resource_type, flavor, version)
-            
-            # Perform strict JSON schema validation using the organization's schema
-            validate_resource_with_public_schema(content, schema_response)
-            
-        except Exception as schema_error:
-            # Provide helpful error message with schema context
-            error_message = str(schema_error)
-            
-            # Try to get schema summary for debugging context
-            try:
-                schema_response = get_resource_schema_public(resource_type, flavor, version)
-                schema_summary = get_schema_validation_summary(schema_response)
-                error_message += f"\n\nSchema Requirements:\n{schema_summary}"
-            except Exception:
-                pass  # Schema summary is helpful but not critical
-            
-            raise McpError(
-                ErrorData(
-                    code=INVALID_REQUEST,
-                    message=f"Resource configuration validation failed: {error_message}"
-                )
+    Raises:
+        McpError: If validation fails for any resource, project cannot be resolved, or creation fails
+    """
+    # Resolve project
+    try:
+        current_project = ClientUtils.resolve_project(project_name)
+    except ValueError as ve:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=str(ve)
             )
+        )
+    project_name_resolved = current_project.name
 
-        # Get project branch
-        api_stack = swagger_client.UiStackControllerApi(ClientUtils.get_client())
-        stack = api_stack.get_stack(project_name_resolved)
-        branch = stack.branch if hasattr(stack, 'branch') and stack.branch else None
+    if not resources:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message="At least one resource must be provided."
+            )
+        )
+
+    try:
+        results = _add_resources(project_name_resolved, resources, dry_run)
 
-        # If dry_run is True, show a preview of the resource rather than creating it
         if dry_run:
-            import json
-            
-            # Format the content for preview
-            formatted_content = json.dumps(content, indent=2) if content else "No content provided"
-            
-            # Display information about inputs if they exist
-            inputs_info = ""
-            if inputs:
-                inputs_info = "\nConnections to other resources:\n"
-                for input_name, input_data in inputs.items():
-                    input_resource = f"{input_data.resource_type}/{input_data.resource_name}"
-                    output_name = input_data.output_name or 'default'
-                    inputs_info += f"  - {input_name}: Connected to {input_resource} (output: {output_name})\n"
-            
-            # Create a structured response for the dry run
             result = {
                 "type": "dry_run",
-                "resource_type": resource_type,
-                "resource_name": resource_name,
-                "flavor": flavor,
-                "version": version,
-                "content_preview": formatted_content,
-                "inputs_preview": inputs_info,
-                "instructions": "THIS IS A IRREVERSIBLE CRITICAL OPERATION, CONFIRM WITH USER if they want to proceed with creating this resource OR ANY CHANGES ARE NEEDED. Only if the user confirms, run the add_resource function again with dry_run=False."
-            }
-            
-            return json.dumps(result, indent=2)
-        else:
-            # Create an API instance and create the resource
-            api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
-            api_instance.create_resources([resource_request], project_name_resolved, branch)
-
-            # Check for errors after the addition
-            dropdown_api = swagger_client.UiDropdownsControllerApi(ClientUtils.get_client())
-            resource_response = dropdown_api.get_resource_by_stack(project_name_resolved, resource_type, resource_name)
-            
-            add_result = {
-                "message": f"Successfully created resource '{resource_name}' of type '{resource_type}'."
+                "resources": results,
+                "instructions": "THIS IS A IRREVERSIBLE CRITICAL OPERATION, CONFIRM WITH USER if they want to proceed with creating these resources OR ANY CHANGES ARE NEEDED. Only if the user confirms, run the add_resources function again with dry_run=False."
             }
-            
-            # Add errors if any
-            if hasattr(resource_response, 'errors') and resource_response.errors:
-                errors = []
-                for error in resource_response.errors:
-                    error_info = {
-                        "message": error.message,
-                        "category": error.category,
-                        "severity": error.severity if hasattr(error, 'severity') else None
-                    }
-                    errors.append(error_info)
-                
-                add_result["errors"] = errors
-                add_result["warning"] = "Resource was added but has validation errors that need to be fixed."
-                
-                # If it's an Invalid Reference Expression, suggest checking outputs
-                if any(error.category == "Invalid Reference Expression" for error in resource_response.errors):
-                    add_result["suggestion"] = "Please call get_resource_output_tree for the resource you are trying to refer to."
-            
-            import json
-            return json.dumps(add_result, indent=2)
 
+            return _dumps(result)
+
+        return _dumps({"results": results})
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
             ErrorData(
                 code=INVALID_REQUEST,
-                message=f"Failed to add resource '{resource_name}' of type '{resource_type}' to project '{project_name_resolved}': {error_message}"
+                message=f"Failed to add resources to project '{project_name_resolved}': {error_message}"
             )
+        ) from e
+
+
+def _delete_resources(project_name: str, resources: List[ResourceIdentifier], dry_run: bool) -> List[Dict[str, Any]]:
+    """
+    Look up resources of a resolved project and, unless dry_run, delete them in one request.
+
+    Shared by delete_resource() and delete_resources(). If any of the resources doesn't exist,
+    nothing is deleted.
+
+    Args:
+        project_name: Name of the resolved project
+        resources: The resources to delete
+        dry_run: If True, only build a preview per resource without deleting anything
+
+    Returns:
+        Per resource, in order: {"resource_type", "resource_name", "directory", "filename"}, plus a
+        truncated "content_preview" if dry_run
+    """
+    # Start the branch lookup now so it overlaps with fetching the resources
+    branch_future = None if dry_run else _background_executor.submit(ClientUtils.get_project_branch, project_name)
+
+    # Get the current resources concurrently to obtain metadata
+    current_resources = list(_background_executor.map(
+        lambda resource: _get_cached_resource(
+            project_name, resource.resource_type, resource.resource_name, include_info=False
+        ),
+        resources
+    ))
+
+    results = [
+        {
+            "resource_type": resource.resource_type,
+            "resource_name": resource.resource_name,
+            "directory": current_resource.get("directory"),
+            "filename": current_resource.get("filename")
+        }
+        for resource, current_resource in zip(resources, current_resources)
+    ]
+
+    if dry_run:
+        for result, current_resource in zip(results, current_resources):
+            content_preview = _dumps(current_resource.get("content", {}))[:500]  # Truncate for readability
+            if len(content_preview) >= 500:
+                content_preview += "\n...\n(content truncated for preview)"
+            result["content_preview"] = content_preview
+        return results
+
+    # Delete all resources in a single request
+    resource_requests = [
+        ResourceFileRequest(
+            resource_name=result["resource_name"],
+            resource_type=result["resource_type"],
+            directory=result["directory"],
+            filename=result["filename"]
         )
+        for result in results
+    ]
+    api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
+    api_instance.delete_resources(resource_requests, project_name, branch_future.result())
+    for resource in resources:
+        _resource_cache.pop((project_name, resource.resource_type, resource.resource_name))
+    _module_inputs_cache.clear()
+
+    return results
 
 
 @mcp.tool()
@@ -1087,55 +1757,27 @@ def delete_resource(resource_type: str, resource_name: str, dry_run: bool = True
     project_name_resolved = current_project.name
     
     try:
+        resource = ResourceIdentifier(resource_type=resource_type, resource_name=resource_name)
+        result = _delete_resources(project_name_resolved, [resource], dry_run)[0]
 
-        # First, get the current resource to obtain metadata
-        current_resource = get_resource_by_project(resource_type, resource_name, project_name)
-
-        resource_request = ResourceFileRequest(
-            resource_name=resource_name,
-            resource_type=resource_type,
-            directory=current_resource.get("directory"),
-            filename=current_resource.get("filename")
-        )
-
-        # Get project branch
-        api_stack = swagger_client.UiStackControllerApi(ClientUtils.get_client())
-        stack = api_stack.get_stack(project_name_resolved)
-        branch = stack.branch if hasattr(stack, 'branch') and stack.branch else None
-        
         # If dry_run is True, show a preview of the deletion rather than deleting
         if dry_run:
-            import json
-            
-            # Get more details about the resource for confirmation
-            content_preview = json.dumps(current_resource.get("content", {}), indent=2)[:500]  # Truncate for readability
-            if len(content_preview) >= 500:
-                content_preview += "\n...\n(content truncated for preview)"
-                
             # Warn about potential dependencies
             dependencies_warning = ("\nWARNING: Deleting this resource may affect other resources that depend on it. "
                                   "Please check for dependencies before confirming deletion.")
-            
+
             # Create a structured response for the dry run
-            result = {
+            return _dumps({
                 "type": "dry_run",
-                "resource_type": resource_type,
-                "resource_name": resource_name,
-                "directory": current_resource.get("directory"),
-                "filename": current_resource.get("filename"),
-                "content_preview": content_preview,
+                **result,
                 "warning": dependencies_warning,
                 "instructions": "This will PERMANENTLY DELETE the resource shown above. ASK THE USER EXPLICITLY if they want to proceed with deleting this resource. Only if the user EXPLICITLY confirms, run the delete_resource function again with dry_run=False."
-            }
-            
-            return json.dumps(result, indent=2)
-        else:
-            # Create an API instance and delete the resource
-            api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
-            api_instance.delete_resources([resource_request], project_name_resolved, branch)
+            })
 
-            return f"Successfully deleted resource '{resource_name}' of type '{resource_type}'."
+        return f"Successfully deleted resource '{resource_name}' of type '{resource_type}'."
 
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -1143,8 +1785,88 @@ def delete_resource(resource_type: str, resource_name: str, dry_run: bool = True
                 code=INVALID_REQUEST,
                 message=f"Failed to delete resource '{resource_name}' of type '{resource_type}' from project '{project_name_resolved}': {error_message}"
             )
+        ) from e
+
+
+@mcp.tool()
+def delete_resources(resources: List[ResourceIdentifier], dry_run: bool = True, project_name: str = "") -> str:
+    """
+    Delete several resources from the current project in a single request.
+
+    IMPORTANT: This is an irreversible operation that permanently removes resources.
+    Always run with `dry_run=True` first to confirm which resources will be deleted.
+
+    Use this instead of calling delete_resource() repeatedly when removing multiple resources.
+    If any of the resources doesn't exist, nothing is deleted.
+
+    Steps for safe resource deletion:
+    1. Always run with `dry_run=True` first to confirm the resource details.
+    2. Review the resources that will be deleted, including any potential dependencies.
+    3. ASK THE USER EXPLICITLY if they want to proceed with deleting these resources.
+    4. Only if user explicitly confirms, run again with `dry_run=False` to delete the resources.
+
+    **Parameter Resolution Hierarchy:**
+    - project_name: If provided, uses this project; otherwise falls back to current project context
+
+    Args:
+        resources: List of ResourceIdentifier objects with the resource_type and resource_name to delete
+        dry_run: If True, only preview the deletion without actually deleting. Default is True.
+        project_name: Optional - Project name to use (overrides current project context)
+
+    Returns:
+        Preview of deletion (if dry_run=True) or confirmation of deletion (if dry_run=False)
+
+    Raises:
+        McpError: If a resource doesn't exist, project cannot be resolved, or deletion fails
+    """
+    # Resolve project
+    try:
+        current_project = ClientUtils.resolve_project(project_name)
+    except ValueError as ve:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=str(ve)
+            )
+        )
+    project_name_resolved = current_project.name
+
+    if not resources:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message="At least one resource must be provided."
+            )
         )
 
+    try:
+        results = _delete_resources(project_name_resolved, resources, dry_run)
+
+        if dry_run:
+            result = {
+                "type": "dry_run",
+                "resources": results,
+                "warning": "Deleting these resources may affect other resources that depend on them. "
+                           "Please check for dependencies before confirming deletion.",
+                "instructions": "This will PERMANENTLY DELETE the resources shown above. ASK THE USER EXPLICITLY if they want to proceed with deleting these resources. Only if the user EXPLICITLY confirms, run the delete_resources function again with dry_run=False."
+            }
+
+            return _dumps(result)
+
+        deleted = ", ".join(f"'{resource.resource_name}' of type '{resource.resource_type}'" for resource in resources)
+        return f"Successfully deleted resources {deleted}."
+
+    except McpError:
+        raise
+    except Exception as e:
+        error_message = ClientUtils.extract_error_message(e)
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Failed to delete resources from project '{project_name_resolved}': {error_message}"
+            )
+        ) from e
+
 
 @mcp.tool()
 def get_spec_for_module(intent: str, flavor: str, version: str) -> Dict[str, Any]:
@@ -1185,17 +1907,8 @@ def get_spec_for_module(intent: str, flavor: str, version: str) -> Dict[str, Any
     
     try:
 
-        # Call the TF Module API to get the spec
-        api_instance = swagger_client.ModuleManagementApi(ClientUtils.get_client())
-        module_response = api_instance.get_module_for_ifv_and_stack(
-            flavor=flavor,
-            intent=intent,
-            stack_name=project_name,
-            version=version
-        )
-
-        # Extract and parse the spec from the response
-        if not module_response.spec:
+        spec = _get_module_spec(intent, flavor, version, project_name)
+        if spec is None:
             raise McpError(
                 ErrorData(
                     code=INVALID_REQUEST,
@@ -1203,9 +1916,10 @@ def get_spec_for_module(intent: str, flavor: str, version: str) -> Dict[str, Any
                 )
             )
 
-        # Return the spec as a JSON object
-        return json.loads(module_response.spec)
+        return spec
 
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -1213,7 +1927,7 @@ def get_spec_for_module(intent: str, flavor: str, version: str) -> Dict[str, Any
                 code=INVALID_REQUEST,
                 message=f"Failed to get specification for module with intent '{intent}', flavor '{flavor}', version '{version}' in project '{project_name}': {error_message}"
             )
-        )
+        ) from e
 
 
 @mcp.tool()
@@ -1279,17 +1993,8 @@ def get_sample_for_module(intent: str, flavor: str, version: str) -> Dict[str, A
     
     try:
 
-        # Call the TF Module API to get the module
-        api_instance = swagger_client.ModuleManagementApi(ClientUtils.get_client())
-        module_response = api_instance.get_module_for_ifv_and_stack(
-            flavor=flavor,
-            intent=intent,
-            stack_name=project_name,
-            version=version
-        )
-
-        # Extract and parse the sample JSON from the response
-        if not module_response.sample_json:
+        _, sample = _get_module_definition(intent, flavor, version, project_name)
+        if sample is None:
             raise McpError(
                 ErrorData(
                     code=INVALID_REQUEST,
@@ -1297,9 +2002,10 @@ def get_sample_for_module(intent: str, flavor: str, version: str) -> Dict[str, A
                 )
             )
 
-        # Return the sample JSON as a JSON object
-        return json.loads(module_response.sample_json)
+        return sample
 
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -1307,7 +2013,75 @@ def get_sample_for_module(intent: str, flavor: str, version: str) -> Dict[str, A
                 code=INVALID_REQUEST,
                 message=f"Failed to get sample JSON for module with intent '{intent}', flavor '{flavor}', version '{version}' in project '{project_name}': {error_message}"
             )
+        ) from e
+
+
+@mcp.tool()
+def get_module_details(intent: str, flavor: str, version: str) -> Dict[str, Any]:
+    """
+    Get everything needed to design a new resource for a module in one call.
+
+    Returns the module's spec (as get_spec_for_module() would), its sample configuration (as
+    get_sample_for_module() would) and its inputs with compatible resources (as get_module_inputs()
+    would). The spec/sample and the inputs are fetched concurrently.
+
+    Use this instead of calling those three tools one after another when preparing add_resource().
+    The same rules apply: if a required input has multiple compatible resources, ASK THE USER
+    which one to use.
+
+    **Prerequisites:**
+    - Current project must be set (use `use_project()` first)
+
+    Args:
+        intent: Resource type (e.g., "postgres", "service", "redis")
+        flavor: Implementation variant (e.g., "rds", "cloudsql", "k8s")
+        version: Module version (e.g., "0.2", "1.0")
+
+    Returns:
+        Dict containing:
+            - spec: Schema for the "spec" section of the resource (None if the module has none)
+            - sample: Complete sample configuration (None if the module has none)
+            - inputs: Input names mapped to ModuleInputSpec objects, including compatible resources
+
+    Raises:
+        McpError: If no current project is set or the module cannot be fetched
+    """
+    # Get current project
+    current_project = ClientUtils.get_current_project()
+    if not current_project:
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message="No current project is set. Please set a project using project_tools.use_project()."
+            )
+        )
+    project_name = current_project.name
+
+    try:
+        # Fetch the module inputs alongside the spec and sample
+        inputs_future = _background_executor.submit(
+            _module_inputs_cache.get_or_set,
+            (project_name, intent, flavor),
+            lambda: _fetch_module_inputs(project_name, intent, flavor)
         )
+        spec, sample = _get_module_definition(intent, flavor, version, project_name)
+
+        return {
+            "spec": spec,
+            "sample": sample,
+            "inputs": inputs_future.result()
+        }
+
+    except McpError:
+        raise
+    except Exception as e:
+        error_message = ClientUtils.extract_error_message(e)
+        raise McpError(
+            ErrorData(
+                code=INVALID_REQUEST,
+                message=f"Failed to get details for module with intent '{intent}', flavor '{flavor}', version '{version}' in project '{project_name}': {error_message}"
+            )
+        ) from e
 
 
 @mcp.tool()
@@ -1342,7 +2116,7 @@ def get_output_references(output_type: str, project_name: str = "") -> List[Dict
     
     try:
 
-        api_instance = swagger_client.UiDropdownsControllerApi(ClientUtils.get_client())
+        api_instance = ClientUtils.get_api(swagger_client.UiDropdownsControllerApi)
 
         # Call the API to get output references
         references = api_instance.get_output_references(project_name_resolved, output_type)
@@ -1362,35 +2136,22 @@ def get_output_references(output_type: str, project_name: str = "") -> List[Dict
 
         return formatted_references
 
+    except McpError:
+        raise
     except Exception as e:
         raise McpError(
             ErrorData(
                 code=INVALID_REQUEST,
                 message=f"Failed to get output references for project '{project_name_resolved}' and output type '{output_type}': {str(e)}"
             )
-        )
+        ) from e
 
 
-@mcp.tool()
-def explain_ui_annotation(annotation_name: str) -> str:
-    """
-    Get explanation and handling instructions for UI annotations in resource specifications.
-    
-    In the specification of modules, fields may contain special UI annotations that start with "x-ui-". 
-    These annotations provide additional instructions on how to handle and process these fields.
-    You should use this information when generating or modifying resource specifications.
-    
-    Args:
-        annotation_name: The name of the UI annotation to explain (e.g., "x-ui-secret-ref")
-        
-    Returns:
-        Detailed explanation of the annotation and instructions for handling fields with this annotation
-    """
-    # Dictionary of known UI annotations with their explanations and handling instructions
-    ui_annotations = {
-        "x-ui-secret-ref": {
-            "description": "Indicates that the field value should be treated as sensitive and stored as a secret.",
-            "handling": """
+# Known UI annotations with their explanations and handling instructions
+_UI_ANNOTATIONS = {
+    "x-ui-secret-ref": {
+        "description": "Indicates that the field value should be treated as sensitive and stored as a secret.",
+        "handling": """
 When a field has 'x-ui-secret-ref' set to true:
 
 1. DO NOT insert the actual value directly in the resource JSON
@@ -1405,10 +2166,10 @@ If a database password field has 'x-ui-secret-ref: true', instead of:
 Use:
   "password": "${blueprint.self.secrets.db_password}"
 """
-        },
-        "x-ui-output-type": {
-            "description": "Indicates that the field can reference output from another resource in the project.",
-            "handling": """
+    },
+    "x-ui-output-type": {
+        "description": "Indicates that the field can reference output from another resource in the project.",
+        "handling": """
 When a field has 'x-ui-output-type' set to a value (e.g., "iam_policy_arn", "database_connection_string"):
 
 1. Call the 'get_output_references' tool with the project name and the output type value
@@ -1423,20 +2184,36 @@ If an 'apiUrl' field has 'x-ui-output-type: "iam_policy_arn"', after calling get
 - After user selects: "Using reference to API Gateway URL"
 - Set the value using the 'reference' field from the selected output
 """
-        },
-        # Add more annotations here as they are discovered/implemented
-    }
+    },
+    # Add more annotations here as they are discovered/implemented
+}
+
 
+@mcp.tool()
+def explain_ui_annotation(annotation_name: str) -> str:
+    """
+    Get explanation and handling instructions for UI annotations in resource specifications.
+    
+    In the specification of modules, fields may contain special UI annotations that start with "x-ui-". 
+    These annotations provide additional instructions on how to handle and process these fields.
+    You should use this information when generating or modifying resource specifications.
+    
+    Args:
+        annotation_name: The name of the UI annotation to explain (e.g., "x-ui-secret-ref")
+        
+    Returns:
+        Detailed explanation of the annotation and instructions for handling fields with this annotation
+    """
     # Check if the annotation exists in our dictionary
-    if annotation_name in ui_annotations:
-        annotation = ui_annotations[annotation_name]
+    if annotation_name in _UI_ANNOTATIONS:
+        annotation = _UI_ANNOTATIONS[annotation_name]
 
         # Format the response
-        response = f"# {annotation_name}\n\n"
-        response += f"**Description:** {annotation['description']}\n\n"
-        response += f"**Handling Instructions:**\n{annotation['handling']}"
-
-        return response
+        return (
+            f"# {annotation_name}\n\n"
+            f"**Description:** {annotation['description']}\n\n"
+            f"**Handling Instructions:**\n{annotation['handling']}"
+        )
 
     # For unknown annotations, provide a generic response
     return f"""
@@ -1483,7 +2260,7 @@ def get_resource_output_tree(resource_type: str, project_name: str = "") -> Dict
     try:
 
         # Create an API instance
-        api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
+        api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
 
         # Call the API to get autocomplete data
         autocomplete_data = api_instance.get_autocomplete_data(project_name_resolved)
@@ -1518,6 +2295,8 @@ def get_resource_output_tree(resource_type: str, project_name: str = "") -> Dict
             "reference_format": f"${{resourceType.resourceName.out.x.y}} where resourceType='{resource_type}' and out.x.y is the path to the desired output"
         }
 
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -1525,7 +2304,7 @@ def get_resource_output_tree(resource_type: str, project_name: str = "") -> Dict
                 code=INVALID_REQUEST,
                 message=f"Failed to get output tree for resource type '{resource_type}' in project '{project_name}': {error_message}"
             )
-        )
+        ) from e
 
 
 def _extract_attribute_paths(obj: Any, current_path: str) -> List[str]:
@@ -1617,7 +2396,7 @@ def get_resource_outputs(
 
     try:
         # Create API instance
-        api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
+        api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
 
         # Call the autocomplete v2 API which returns module-specific output trees
         response = api_instance.get_autocomplete_data_v2(stack_name=project_name_resolved)
@@ -1671,6 +2450,8 @@ def get_resource_outputs(
 
         return result
 
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -1678,6 +2459,74 @@ def get_resource_outputs(
                 code=INVALID_REQUEST,
                 message=f"Failed to get resource output references for project '{project_name}': {error_message}"
             )
+        ) from e
+
+
+def _fetch_available_resources(project_name: str) -> List[Dict[str, Any]]:
+    """
+    Fetch the catalog of resource types and flavors available to a project.
+
+    Args:
+        project_name: Name of the project to fetch modules for
+
+    Returns:
+        List of resource entries with type, flavor, version, description and display name
+    """
+    # Create an API instance
+    api_instance = ClientUtils.get_api(swagger_client.ModuleManagementApi)
+
+    # Get grouped modules for the specified project
+    response = api_instance.get_grouped_modules_for_stack(project_name)
+
+    # The resources property is a nested dictionary structure
+    # The first level key is not relevant (usually 'resources')
+    # The second level key is the intent (resource type), which has a list of modules
+    if not response.resources:
+        return []
+
+    result = []
+    for resource_types in response.resources.values():
+        for resource_type, resource_info in resource_types.items():
+            if not (resource_info and resource_info.modules):
+                continue
+
+            # Shared by every module of the resource type
+            description = resource_info.description or ""
+            display_name = resource_info.display_name or resource_type
+
+            result.extend(
+                {
+                    "resource_type": resource_type,  # This is the intent
+                    "flavor": flavor,
+                    "version": version,
+                    "description": description,
+                    "display_name": display_name,
+                }
+                for flavor, version in map(_module_fields, resource_info.modules)
+            )
+
+    return result
+
+
+def _prefetch_module_definitions(project_name: str, resources: List[Dict[str, Any]]) -> None:
+    """
+    Start fetching the spec and sample of every listed module in the background.
+
+    Listing the catalog is usually followed by get_spec_for_module() and get_sample_for_module()
+    for the module the user picks, so those calls can then be served from the module cache.
+    Large catalogs are skipped, and failures are ignored; the module is then fetched on demand.
+
+    Args:
+        project_name: Name of the project the catalog was listed for
+        resources: Entries returned by _fetch_available_resources()
+    """
+    if len(resources) > MAX_PREFETCHED_MODULES:
+        return
+
+    for resource in resources:
+        _prefetch_executor.submit(
+            _get_module_definition,
+            resource["resource_type"], resource["flavor"], resource["version"], project_name
         )
 
 
@@ -1748,42 +2597,60 @@ def list_available_resources() -> List[Dict[str, Any]]:
     project_name = current_project.name
 
     try:
-        # Create an API instance
-        api_instance = swagger_client.ModuleManagementApi(ClientUtils.get_client())
-
-        # Get grouped modules for the specified project
-        response = api_instance.get_grouped_modules_for_stack(project_name)
-
-        # Process the response to extract resource information
-        result = []
-
-        # The resources property is a nested dictionary structure
-        # The first level key is not relevant (usually 'resources')
-        # The second level key is the intent (resource type)
-        if response.resources:
-            for _, resource_types in response.resources.items():
-                for resource_type, resource_info in resource_types.items():
-                    # Each resource type (intent) has a list of modules
-                    if resource_info and resource_info.modules:
-                        for module in resource_info.modules:
-                            resource_data = {
-                                "resource_type": resource_type,  # This is the intent
-                                "flavor": module.flavor,
-                                "version": module.version,
-                                "description": resource_info.description or "",
-                                "display_name": resource_info.display_name or resource_type,
-                            }
-                            result.append(resource_data)
+        def fetch_and_prefetch() -> List[Dict[str, Any]]:
+            resources = _fetch_available_resources(project_name)
+            _prefetch_module_definitions(project_name, resources)
+            return resources
 
-        return result
+        # The module catalog changes rarely, so serve repeated calls from a short-lived cache
+        return _available_resources_cache.get_or_set(project_name, fetch_and_prefetch)
 
+    except McpError:
+        raise
     except Exception as e:
         raise McpError(
             ErrorData(
                 code=INVALID_REQUEST,
                 message=f"Failed to list available resources for project '{project_name}': {str(e)}"
             )
-        )
+        ) from e
+
+
+def _fetch_resource_schema_public(intent: str, flavor: str, version: str) -> Dict[str, Any]:
+    """
+    Fetch the complete schema of a module from the public API.
+
+    Args:
+        intent: Resource type (e.g., "postgres", "service", "redis")
+        flavor: Implementation variant (e.g., "rds", "cloudsql", "k8s")
+        version: Module version (e.g., "0.2", "1.0")
+
+    Returns:
+        The schema as returned by get_resource_schema_public()
+    """
+    # Create an API instance for public APIs
+    api_instance = ClientUtils.get_api(swagger_client.PublicApIsApi)
+    
+    # Call the public API to get module schema
+    schema_response = api_instance.get_module_schema(
+        intent=intent,
+        flavor=flavor,
+        version=version
+    )
+    
+    # Convert the response to a dictionary for easier consumption
+    result = {
+        "intent": intent,
+        "flavor": flavor,
+        "version": version,
+        "type": schema_response.type,
+        "required": schema_response.required or [],
+        "properties": schema_response.properties or {},
+        "additional_properties": schema_response.additional_properties,
+        "schema": schema_response.schema
+    }
+
+    return result
 
 
 @mcp.tool()
@@ -1837,30 +2704,13 @@ def get_resource_schema_public(intent: str, flavor: str, version: str) -> Dict[s
     **Workflow Integration:** Schema exploration → Template examination → Configuration building
     """
     try:
-        # Create an API instance for public APIs
-        api_instance = swagger_client.PublicApIsApi(ClientUtils.get_client())
-        
-        # Call the public API to get module schema
-        schema_response = api_instance.get_module_schema(
-            intent=intent,
-            flavor=flavor,
-            version=version
+        # Schemas are fetched on every add and update, so serve repeated lookups from the cache
+        return _public_schema_cache.get_or_set(
+            (intent, flavor, version),
+            lambda: _fetch_resource_schema_public(intent, flavor, version)
         )
-        
-        # Convert the response to a dictionary for easier consumption
-        result = {
-            "intent": intent,
-            "flavor": flavor,
-            "version": version,
-            "type": schema_response.type,
-            "required": schema_response.required or [],
-            "properties": schema_response.properties or {},
-            "additional_properties": schema_response.additional_properties,
-            "schema": schema_response.schema
-        }
-        
-        return result
-        
+    except McpError:
+        raise
     except Exception as e:
         error_message = ClientUtils.extract_error_message(e)
         raise McpError(
@@ -1868,4 +2718,4 @@ def get_resource_schema_public(intent: str, flavor: str, version: str) -> Dict[s
                 code=INVALID_REQUEST,
                 message=f"Failed to get schema for resource with intent '{intent}', flavor '{flavor}', version '{version}': {error_message}"
             )
-        )
+        ) from e
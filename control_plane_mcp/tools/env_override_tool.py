@@ -1,3 +1,4 @@
+from ..utils.cache_utils import TTLCache
 from ..utils.client_utils import ClientUtils
 from ..utils.dict_utils import deep_merge
 from ..utils.override_utils import get_nested_property, set_nested_property, remove_nested_property
@@ -5,11 +6,50 @@ from ..config import mcp
 import swagger_client
 from swagger_client.models import OverrideRequest
 from typing import Dict, Any, Optional, Union
-import json
+import orjson
 import copy
 from mcp.shared.exceptions import McpError
 from mcp.types import ErrorData, INVALID_REQUEST
 
+# Parsed overrides keyed by (cluster_id, resource_type, resource_name); entries are dropped after every write
+_overrides_cache = TTLCache(ttl=5, maxsize=256)
+
+
+def _get_current_overrides(api_instance, cluster_id: str, resource_type: str, resource_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the parsed overrides of a resource, served from a short-lived cache.
+
+    Returns:
+        A copy of the current overrides, or None if the resource has none
+    """
+    def fetch():
+        current_override_obj = api_instance.get_resource_override_object(
+            cluster_id=cluster_id,
+            resource_name=resource_name,
+            resource_type=resource_type
+        )
+        if current_override_obj and hasattr(current_override_obj, 'overrides') and current_override_obj.overrides:
+            if isinstance(current_override_obj.overrides, str):
+                return orjson.loads(current_override_obj.overrides)
+            return current_override_obj.overrides
+        return None
+
+    overrides = _overrides_cache.get_or_set((cluster_id, resource_type, resource_name), fetch)
+    return copy.deepcopy(overrides) if overrides is not None else None
+
+
+def _post_overrides(api_instance, override_request: OverrideRequest, cluster_id: str, resource_type: str, resource_name: str):
+    """Apply an override request and drop the cached overrides of the resource."""
+    try:
+        return api_instance.post_resource_override_object(
+            body=override_request,
+            cluster_id=cluster_id,
+            resource_name=resource_name,
+            resource_type=resource_type
+        )
+    finally:
+        _overrides_cache.pop((cluster_id, resource_type, resource_name))
+
 
 @mcp.tool()
 def add_or_update_override_property(resource_type: str, resource_name: str, property_path: str, value: Any, project_name: str = "", env_name: str = "") -> Dict[str, Any]:
@@ -51,25 +91,12 @@ def add_or_update_override_property(resource_type: str, resource_name: str, prop
         )
     
     # Create an instance of the API class
-    api_instance = swagger_client.UiApplicationControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiApplicationControllerApi)
     
     try:
         # Get current overrides
         try:
-            current_override_obj = api_instance.get_resource_override_object(
-                cluster_id=cluster_id,
-                resource_name=resource_name,
-                resource_type=resource_type
-            )
-            
-            # Parse existing overrides
-            if current_override_obj and hasattr(current_override_obj, 'overrides') and current_override_obj.overrides:
-                if isinstance(current_override_obj.overrides, str):
-                    current_overrides = json.loads(current_override_obj.overrides)
-                else:
-                    current_overrides = current_override_obj.overrides
-            else:
-                current_overrides = {}
+            current_overrides = _get_current_overrides(api_instance, cluster_id, resource_type, resource_name) or {}
         except Exception:
             # If getting current overrides fails, start with empty overrides
             current_overrides = {}
@@ -85,12 +112,7 @@ def add_or_update_override_property(resource_type: str, resource_name: str, prop
         override_request.overrides = current_overrides
         
         # Apply the updated overrides
-        result = api_instance.post_resource_override_object(
-            body=override_request,
-            cluster_id=cluster_id,
-            resource_name=resource_name,
-            resource_type=resource_type
-        )
+        result = _post_overrides(api_instance, override_request, cluster_id, resource_type, resource_name)
         
         # Format and return the result
         return {
@@ -152,24 +174,13 @@ def remove_override_property(resource_type: str, resource_name: str, property_pa
         )
     
     # Create an instance of the API class
-    api_instance = swagger_client.UiApplicationControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiApplicationControllerApi)
     
     try:
         # Get current overrides
         try:
-            current_override_obj = api_instance.get_resource_override_object(
-                cluster_id=cluster_id,
-                resource_name=resource_name,
-                resource_type=resource_type
-            )
-            
-            # Parse existing overrides
-            if current_override_obj and hasattr(current_override_obj, 'overrides') and current_override_obj.overrides:
-                if isinstance(current_override_obj.overrides, str):
-                    current_overrides = json.loads(current_override_obj.overrides)
-                else:
-                    current_overrides = current_override_obj.overrides
-            else:
+            current_overrides = _get_current_overrides(api_instance, cluster_id, resource_type, resource_name)
+            if not current_overrides:
                 return {
                     "message": f"No overrides found for resource '{resource_name}' of type '{resource_type}' in environment '{current_environment.name}'",
                     "resource_name": resource_name,
@@ -211,12 +222,7 @@ def remove_override_property(resource_type: str, resource_name: str, property_pa
             override_request.overrides = {}
         
         # Apply the updated overrides
-        result = api_instance.post_resource_override_object(
-            body=override_request,
-            cluster_id=cluster_id,
-            resource_name=resource_name,
-            resource_type=resource_type
-        )
+        result = _post_overrides(api_instance, override_request, cluster_id, resource_type, resource_name)
         
         # Format and return the result
         message = f"Successfully removed override property '{property_path}' for resource '{resource_name}' of type '{resource_type}' in environment '{current_environment.name}'"
@@ -282,7 +288,7 @@ def replace_all_overrides(resource_type: str, resource_name: str, override_data:
         )
     
     # Create an instance of the API class
-    api_instance = swagger_client.UiApplicationControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiApplicationControllerApi)
     
     try:
         # Create the override request object
@@ -293,12 +299,7 @@ def replace_all_overrides(resource_type: str, resource_name: str, override_data:
         override_request.overrides = override_data
         
         # Call the API to apply the override
-        result = api_instance.post_resource_override_object(
-            body=override_request,
-            cluster_id=cluster_id,
-            resource_name=resource_name,
-            resource_type=resource_type
-        )
+        result = _post_overrides(api_instance, override_request, cluster_id, resource_type, resource_name)
         
         # Format and return the result
         return {
@@ -357,7 +358,7 @@ def clear_all_overrides(resource_type: str, resource_name: str, project_name: st
         )
     
     # Create an instance of the API class
-    api_instance = swagger_client.UiApplicationControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiApplicationControllerApi)
     
     try:
         # Create an empty override request
@@ -368,12 +369,7 @@ def clear_all_overrides(resource_type: str, resource_name: str, project_name: st
         override_request.overrides = {}
         
         # Call the API to clear all overrides
-        result = api_instance.post_resource_override_object(
-            body=override_request,
-            cluster_id=cluster_id,
-            resource_name=resource_name,
-            resource_type=resource_type
-        )
+        result = _post_overrides(api_instance, override_request, cluster_id, resource_type, resource_name)
         
         return {
             "message": f"Successfully cleared all overrides for resource '{resource_name}' of type '{resource_type}' in environment '{current_environment.name}'",
@@ -432,8 +428,8 @@ def preview_override_effect(resource_type: str, resource_name: str, property_pat
         )
     
     # Create API instances
-    dropdown_api = swagger_client.UiDropdownsControllerApi(ClientUtils.get_client())
-    override_api = swagger_client.UiApplicationControllerApi(ClientUtils.get_client())
+    dropdown_api = ClientUtils.get_api(swagger_client.UiDropdownsControllerApi)
+    override_api = ClientUtils.get_api(swagger_client.UiApplicationControllerApi)
     
     try:
         # Get the current resource configuration
@@ -445,22 +441,12 @@ def preview_override_effect(resource_type: str, resource_name: str, property_pat
         )
         
         # Parse base content
-        base_config = json.loads(resource.content) if resource.content else {}
+        base_config = orjson.loads(resource.content) if resource.content else {}
         
         # Get current overrides
         current_overrides = {}
         try:
-            current_override_obj = override_api.get_resource_override_object(
-                cluster_id=cluster_id,
-                resource_name=resource_name,
-                resource_type=resource_type
-            )
-            
-            if current_override_obj and hasattr(current_override_obj, 'overrides') and current_override_obj.overrides:
-                if isinstance(current_override_obj.overrides, str):
-                    current_overrides = json.loads(current_override_obj.overrides)
-                else:
-                    current_overrides = current_override_obj.overrides
+            current_overrides = _get_current_overrides(override_api, cluster_id, resource_type, resource_name) or {}
         except Exception:
             # No current overrides
             pass
@@ -3,7 +3,7 @@ from ..utils.dict_utils import deep_merge
 from ..config import mcp
 import swagger_client
 from typing import List, Dict, Any, Optional, Annotated
-import json
+import orjson
 import copy
 from mcp.shared.exceptions import McpError
 from mcp.types import ErrorData, INVALID_REQUEST
@@ -59,7 +59,7 @@ def get_all_resources_by_environment(
         )
 
     # Create an instance of the API class
-    api_instance = swagger_client.UiDropdownsControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiDropdownsControllerApi)
 
     try:
         # Call the API to get all resources for the environment
@@ -191,7 +191,7 @@ def get_resource_by_environment(
         )
     
     # Create an instance of the API class
-    api_instance = swagger_client.UiDropdownsControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiDropdownsControllerApi)
     
     try:
         # Call the API directly with resource name, type, and cluster id
@@ -203,7 +203,7 @@ def get_resource_by_environment(
         )
         
         # Parse base content
-        base_config = json.loads(resource.content) if resource.content else None
+        base_config = orjson.loads(resource.content) if resource.content else None
         
         # Get override configuration
         overrides = None
@@ -130,7 +130,7 @@ def get_all_environments(project_name: str = "") -> List[AbstractClusterModel]:
         )
 
     # Create an instance of the API class
-    api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiStackControllerApi)
     # Call the method on the instance
     environments = api_instance.get_clusters_overview(project.name)
     # Convert swagger models to Pydantic models
@@ -209,9 +209,8 @@ def use_environment(environment_name: str):
             )
         )
     
-    # Get all environments directly from the API to avoid conversion issues
-    api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
-    environments = api_instance.get_clusters(project.name)
+    # Get all environments as swagger models to avoid conversion issues
+    environments = ClientUtils.get_project_clusters(project.name)
     
     # Find the environment by name
     found_environment = None
@@ -264,9 +263,9 @@ def get_current_environment_details(project_name: str = "", env_name: str = "")
         )
 
     # Create an instance of the API class to get fresh data
-    api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
-    # Fetch the latest environment details
-    environments = api_instance.get_clusters(project.name)
+    api_instance = ClientUtils.get_api(swagger_client.UiStackControllerApi)
+    # Fetch the latest environment details, bypassing the cached list
+    environments = ClientUtils.get_project_clusters(project.name, refresh=True)
 
     # get environment metadata to fetch the running state of the environment
     cluster_metadata = api_instance.get_cluster_metadata_by_stack(project.name)
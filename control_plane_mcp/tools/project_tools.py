@@ -105,7 +105,7 @@ def create_variable(name: str, variable: VariablesModel, project_name: str = "")
 
     variable_swagger_instance = ClientUtils.pydantic_instance_to_swagger_instance(variable, Variables)
 
-    api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
     result = api_instance.add_variables({name: variable_swagger_instance}, current_project.name)
     ClientUtils.refresh_current_project_and_cache()
     return result
@@ -149,7 +149,7 @@ def update_variable(name: str, variable: VariablesModel, project_name: str = "")
 
     variable_swagger_instance = ClientUtils.pydantic_instance_to_swagger_instance(variable, Variables)
 
-    api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
     result = api_instance.update_variables({name: variable_swagger_instance}, current_project.name)
     ClientUtils.refresh_current_project_and_cache()
 
@@ -201,7 +201,7 @@ def delete_variable(name: str, confirmed_by_user: bool = False, project_name: st
             )
         )
 
-    api_instance = swagger_client.UiBlueprintDesignerControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiBlueprintDesignerControllerApi)
     result = api_instance.delete_variables([name], current_project.name)
     ClientUtils.refresh_current_project_and_cache()
 
@@ -248,7 +248,7 @@ def get_all_projects() -> str:
     - `get_project_details()` - Get detailed info about a specific project
     - `refresh_current_project()` - Refresh current project data
     """
-    api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiStackControllerApi)
     stacks = api_instance.get_stacks()
     # Extract just the stack names and return them as a formatted string
     stack_names = [stack.name for stack in stacks]
@@ -294,7 +294,7 @@ def use_project(project_name: str):
     
     **Context Flow:** Project selection → Environment/resource operations → Configuration management
     """
-    api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiStackControllerApi)
     try:
         project = api_instance.get_stack(project_name)
         ClientUtils.set_current_project(project)
@@ -328,11 +328,9 @@ def refresh_current_project():
             )
         )
 
-    curr_project = ClientUtils.get_current_project()
-    api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
-    refreshed_project = api_instance.get_stack(curr_project.name)
-    ClientUtils.set_current_project(refreshed_project)
-    return refreshed_project
+    # Also clears the projects cached by name, so tools given project_name see the refreshed project
+    ClientUtils.refresh_current_project_and_cache()
+    return ClientUtils.get_current_project()
 
 
 @mcp.tool()
@@ -424,7 +422,7 @@ def get_project_details(project_name: str):
         If a user directly mentions or tries to use a project, use this tool to know its
          availability and details.
     """
-    api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiStackControllerApi)
     project_details = api_instance.get_stack(project_name)
 
     if not project_details:
@@ -545,7 +543,7 @@ def get_variable_environment_values(variable_name: str, project_name: str = ""):
             )
         )
 
-    api_instance = VariableManagementApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(VariableManagementApi)
     try:
         result = api_instance.get_variable_across_environments(current_project.name, variable_name)
         return result
@@ -653,7 +651,7 @@ def update_variable_environment_value(variable_name: str, value: str, project_na
         )
 
     try:
-        api_instance = VariableManagementApi(ClientUtils.get_client())
+        api_instance = ClientUtils.get_api(VariableManagementApi)
         
         # Get current variable configuration across all environments
         current_config = api_instance.get_variable_across_environments(current_project.name, variable_name)
@@ -76,7 +76,7 @@ def get_releases_of_current_environment() -> ListDeploymentsWrapper:
             )
         )
     
-    api_instance = swagger_client.UiDeploymentControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiDeploymentControllerApi)
     deployments = api_instance.get_deployments(ClientUtils.get_current_cluster().id)
 
     return deployments
@@ -102,7 +102,7 @@ def get_release_details(release_id: str) -> DeploymentLog:
             )
         )
     
-    api_instance = swagger_client.UiDeploymentControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiDeploymentControllerApi)
     release = api_instance.get_deployment(ClientUtils.get_current_cluster().id, release_id)
     return release
 
@@ -127,7 +127,7 @@ def get_release_logs_of_current_environment(release_id: str) -> List[DeploymentL
             )
         )
     
-    api_instance = swagger_client.UiDeploymentControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiDeploymentControllerApi)
     release_logs = api_instance.get_deployment_logs(ClientUtils.get_current_cluster().id, release_id)
     return release_logs
 
@@ -219,7 +219,7 @@ def create_release_for_current_environment(properties: DeploymentRequestModel) -
     Raises:
         ValueError: If no current project or environment is set.
     """
-    api_instance = swagger_client.UiDeploymentControllerApi(ClientUtils.get_client())
+    api_instance = ClientUtils.get_api(swagger_client.UiDeploymentControllerApi)
     
     # Create a new DeploymentRequest instance with empty list for required fields
     # Pass required fields directly in the constructor
@@ -1,10 +1,79 @@
 import swagger_client
 from swagger_client.models.stack import Stack
 from swagger_client.models.abstract_cluster import AbstractCluster
+from swagger_client.rest import ApiException
+from urllib3.exceptions import HTTPError
 import os
+import base64
 import configparser
+import contextlib
+import functools
+import hashlib
+import logging
+import threading
+import time
+import orjson
 from pydantic import BaseModel, Field, create_model
-from typing import Any
+from typing import Any, List, Optional
+from .cache_utils import TTLCache
+
+logger = logging.getLogger(__name__)
+
+CREDENTIALS_FILE = "~/.facets/credentials"
+
+# How long a successful login check is trusted before hitting the API again
+LOGIN_CACHE_TTL_SECONDS = 300
+
+# Lower bound for the shared connection pool; tools run on a thread pool and fan out requests,
+# so the generated client's cpu_count * 5 default is too small on single-core hosts
+MIN_CONNECTION_POOL_MAXSIZE = 16
+
+# Environments per project, keyed by project name
+_clusters_cache = TTLCache(ttl=30)
+
+# Projects fetched by name, keyed by project name. Cleared whenever project variables change
+_stacks_cache = TTLCache(ttl=30)
+
+# Project branches, keyed by project name. A branch rarely changes, so it is kept longer than the
+# project itself. Cleared together with the project cache
+_branch_cache = TTLCache(ttl=300)
+
+# The current project and environment as [project, environment], pinned for the tool call running
+# on this thread; see ClientUtils.context_snapshot()
+_context_snapshot = threading.local()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_credentials_file(path: str, mtime_ns: int) -> configparser.ConfigParser:
+    """
+    Parse a Facets CLI credentials file.
+
+    Results are memoized on the file's modification time, so the file is only
+    parsed again after it changes.
+    """
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
+class FacetsApiClient(swagger_client.ApiClient):
+    """
+    ApiClient that decodes JSON response bodies with orjson instead of the stdlib json module.
+    """
+
+    def deserialize(self, response, response_type):
+        if response_type == "file":
+            return super().deserialize(response, response_type)
+
+        try:
+            data = orjson.loads(response.data)
+        except orjson.JSONDecodeError:
+            data = response.data
+
+        # Hand the decoded data to the generated client's (name-mangled) model mapper. The generated
+        # client has no public equivalent, so the SDK is pinned exactly and tests/test_client_utils.py
+        # checks this path against the stock client
+        return self._ApiClient__deserialize(data, response_type)
 
 
 class ClientUtils:
@@ -13,23 +82,147 @@ class ClientUtils:
     token = None
     _current_project: Stack = None  # Use a private variable for the current project
     _current_environment: AbstractCluster = None
+    _api_client: FacetsApiClient = None  # Shared client so the urllib3 connection pool is reused
+    _api_client_lock = threading.Lock()  # Tools run in worker threads, guard lazy client creation
+    _context_lock = threading.Lock()  # Guards the current project and environment
+    _api_instances: dict = {}  # Shared API controller instances, keyed by controller class
 
     @staticmethod
     def set_client_config(url: str, user: str, tok: str):
         ClientUtils.cp_url = url
         ClientUtils.username = user
         ClientUtils.token = tok
+        # Credentials changed, so the shared client has to be rebuilt on next use
+        ClientUtils._api_client = None
 
     @staticmethod
     def get_client():
+        """
+        Get the shared API client, creating it on first use.
+
+        The same ApiClient instance is returned for every call so that keep-alive
+        connections (and their TLS sessions) are reused across tool invocations.
+
+        Returns:
+            FacetsApiClient: The shared API client.
+
+        Raises:
+            ValueError: If the client configuration has not been set.
+        """
         if ClientUtils.cp_url is None or ClientUtils.username is None or ClientUtils.token is None:
             raise ValueError("Client configuration not set. Call set_client_config first.")
 
-        configuration = swagger_client.Configuration()
-        configuration.username = ClientUtils.username
-        configuration.password = ClientUtils.token
-        configuration.host = ClientUtils.cp_url
-        return swagger_client.ApiClient(configuration)
+        api_client = ClientUtils._api_client
+        if api_client is None:
+            with ClientUtils._api_client_lock:
+                api_client = ClientUtils._api_client
+                if api_client is None:
+                    configuration = swagger_client.Configuration()
+                    configuration.host = ClientUtils.cp_url
+                    configuration.connection_pool_maxsize = max(
+                        configuration.connection_pool_maxsize, MIN_CONNECTION_POOL_MAXSIZE
+                    )
+                    # Encode the basic auth header once and send it as a default header; with
+                    # username/password left unset the generated client skips re-encoding it per request
+                    credentials = f"{ClientUtils.username}:{ClientUtils.token}".encode()
+                    auth_header = f"Basic {base64.b64encode(credentials).decode()}"
+                    api_client = FacetsApiClient(
+                        configuration, header_name="Authorization", header_value=auth_header
+                    )
+                    ClientUtils._api_client = api_client
+        return api_client
+
+    @staticmethod
+    def get_api(api_class):
+        """
+        Get a shared instance of a swagger API controller bound to the shared client.
+
+        Controllers hold no per-request state, so one instance per class is reused instead of
+        constructing a new one on every tool call. The instance is rebuilt if the shared
+        client has been replaced since it was created.
+
+        Args:
+            api_class: The swagger_client API class (e.g. swagger_client.UiStackControllerApi)
+
+        Returns:
+            An instance of api_class using the shared API client.
+        """
+        api_client = ClientUtils.get_client()
+        api_instance = ClientUtils._api_instances.get(api_class)
+        if api_instance is None or api_instance.api_client is not api_client:
+            api_instance = api_class(api_client)
+            ClientUtils._api_instances[api_class] = api_instance
+        return api_instance
+
+    @staticmethod
+    def close_client():
+        """
+        Release the shared API client and its pooled connections.
+        """
+        api_client = ClientUtils._api_client
+        ClientUtils._api_client = None
+        if api_client is not None:
+            api_client.rest_client.pool_manager.clear()
+            api_client.pool.close()
+            api_client.pool.join()
+
+    @staticmethod
+    def _login_cache_path() -> str:
+        """
+        Get the path of the login marker file for the configured credentials.
+
+        The file name is derived from a hash of the URL, username and token so that
+        changing any of them forces a fresh login check.
+        """
+        cache_home = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        credentials = f"{ClientUtils.cp_url}\0{ClientUtils.username}\0{ClientUtils.token}"
+        digest = hashlib.sha256(credentials.encode()).hexdigest()[:16]
+        return os.path.join(cache_home, "facets-mcp", f"login_ok_{digest}")
+
+    @staticmethod
+    def _is_login_cached() -> bool:
+        """Check whether a login with the current credentials succeeded recently."""
+        try:
+            return time.time() - os.stat(ClientUtils._login_cache_path()).st_mtime < LOGIN_CACHE_TTL_SECONDS
+        except OSError:
+            return False
+
+    @staticmethod
+    def _mark_login_cached():
+        """Record a successful login for the current credentials."""
+        path = ClientUtils._login_cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w"):
+                pass
+        except OSError as e:
+            # The marker is only an optimization, never fail startup because of it
+            logger.debug(f"Could not write login cache marker: {e}")
+
+    @staticmethod
+    def test_login() -> bool:
+        """
+        Test login using the ApplicationController.
+
+        A successful check is remembered for LOGIN_CACHE_TTL_SECONDS so that quick
+        restarts (client reconnects, dev reloads) skip the network round trip.
+
+        Returns:
+            bool: True if login is successful, False otherwise.
+        """
+        if ClientUtils._is_login_cached():
+            logger.debug("Skipping login test, credentials were verified recently.")
+            return True
+
+        try:
+            api_instance = ClientUtils.get_api(swagger_client.ApplicationControllerApi)
+            api_instance.me()
+        except (ApiException, HTTPError) as e:
+            logger.error(f"Login test failed: {e}")
+            return False
+
+        ClientUtils._mark_login_cached()
+        return True
 
     @staticmethod
     def initialize():
@@ -50,8 +243,12 @@ class ClientUtils:
 
         if profile and not (cp_url and username and token):
             # Assume credentials exist in ~/.facets/credentials
-            config = configparser.ConfigParser()
-            config.read(os.path.expanduser("~/.facets/credentials"))
+            credentials_path = os.path.expanduser(CREDENTIALS_FILE)
+            try:
+                mtime_ns = os.stat(credentials_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            config = _load_credentials_file(credentials_path, mtime_ns)
 
             if config.has_section(profile):
                 cp_url = config.get(profile, "control_plane_url", fallback=cp_url)
@@ -74,6 +271,26 @@ class ClientUtils:
         ClientUtils.set_client_config(cp_url, username, token)
         return cp_url, username, token, profile
 
+    @staticmethod
+    @contextlib.contextmanager
+    def context_snapshot():
+        """
+        Pin the current project and environment for the calling thread.
+
+        Tools run concurrently in worker threads, so a use_project() or use_environment() call can
+        land while another tool is running. Inside this context the getters return the values
+        taken on entry. Only the calling thread's own set_current_project() or
+        set_current_cluster() calls change them.
+        """
+        with ClientUtils._context_lock:
+            snapshot = [ClientUtils._current_project, ClientUtils._current_environment]
+        previous = getattr(_context_snapshot, "value", None)
+        _context_snapshot.value = snapshot
+        try:
+            yield
+        finally:
+            _context_snapshot.value = previous
+
     @staticmethod
     def set_current_project(project: Stack):
         """
@@ -82,7 +299,11 @@ class ClientUtils:
         Args:
             project (Stack): The complete project object to set as current.
         """
-        ClientUtils._current_project = project
+        with ClientUtils._context_lock:
+            ClientUtils._current_project = project
+        snapshot = getattr(_context_snapshot, "value", None)
+        if snapshot is not None:
+            snapshot[0] = project
 
     @staticmethod
     def set_current_cluster(environment: AbstractCluster):
@@ -92,7 +313,11 @@ class ClientUtils:
         Args:
             environment (AbstractCluster): The complete environment object to set as current.
         """
-        ClientUtils._current_environment = environment
+        with ClientUtils._context_lock:
+            ClientUtils._current_environment = environment
+        snapshot = getattr(_context_snapshot, "value", None)
+        if snapshot is not None:
+            snapshot[1] = environment
 
     @staticmethod
     def get_current_project() -> Stack:
@@ -102,7 +327,8 @@ class ClientUtils:
         Returns:
             Stack: The current project object.
         """
-        return ClientUtils._current_project
+        snapshot = getattr(_context_snapshot, "value", None)
+        return snapshot[0] if snapshot is not None else ClientUtils._current_project
 
     @staticmethod
     def get_current_cluster() -> AbstractCluster:
@@ -112,7 +338,8 @@ class ClientUtils:
         Returns:
             AbstractCluster: The current environment object.
         """
-        return ClientUtils._current_environment
+        snapshot = getattr(_context_snapshot, "value", None)
+        return snapshot[1] if snapshot is not None else ClientUtils._current_environment
 
     @staticmethod
     def is_current_cluster_and_project_set() -> bool:
@@ -122,7 +349,7 @@ class ClientUtils:
         Returns:
             bool: True if the current environment is set and current project is set.
         """
-        return ClientUtils._current_environment is not None and ClientUtils._current_project is not None
+        return ClientUtils.get_current_cluster() is not None and ClientUtils.get_current_project() is not None
     
     @staticmethod
     def pydantic_instance_to_swagger_instance(pydantic_instance, swagger_class):
@@ -151,12 +378,15 @@ class ClientUtils:
         """
         Refresh the current project data from the server and update the cache.
         """
+        # Variables are read from the project, so projects cached by name may be stale as well
+        _stacks_cache.clear()
+        _branch_cache.clear()
+
         curr_project = ClientUtils.get_current_project()
         if not curr_project:
             raise ValueError("No current project is set.")
 
-        api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
-        refreshed_project = api_instance.get_stack(curr_project.name)
+        refreshed_project = ClientUtils.get_project(curr_project.name, refresh=True)
         ClientUtils.set_current_project(refreshed_project)
 
     @staticmethod
@@ -168,8 +398,7 @@ class ClientUtils:
         error_message = None
         if hasattr(e, 'body'):
             try:
-                import json
-                body = json.loads(e.body)
+                body = orjson.loads(e.body)
                 error_message = (
                     body.get('message') or
                     body.get('error') or
@@ -182,6 +411,50 @@ class ClientUtils:
             error_message = str(e)
         return error_message
 
+    @staticmethod
+    def get_project(project_name: str, refresh: bool = False) -> Stack:
+        """
+        Get a project by name.
+
+        The project is served from a short-lived cache so that tools resolving a project by
+        name, and then looking up its branch, fetch it only once.
+
+        Args:
+            project_name: Name of the project.
+            refresh: If True, always fetch from the server and update the cache.
+
+        Returns:
+            Stack: The project object.
+        """
+        if not refresh:
+            project = _stacks_cache.get(project_name)
+            if project is not None:
+                return project
+
+        api_instance = ClientUtils.get_api(swagger_client.UiStackControllerApi)
+        project = api_instance.get_stack(project_name)
+        _stacks_cache.set(project_name, project)
+        return project
+
+    @staticmethod
+    def get_project_branch(project_name: str) -> Optional[str]:
+        """
+        Get the branch that resource changes for a project should be written to.
+
+        Branches are cached for a few minutes; refresh_current_project_and_cache() clears them.
+
+        Args:
+            project_name: Name of the project.
+
+        Returns:
+            Optional[str]: The project's branch, or None if the project has no branch set.
+        """
+        # Reuses the project if the calling tool just resolved it by name
+        return _branch_cache.get_or_set(
+            project_name,
+            lambda: getattr(ClientUtils.get_project(project_name), 'branch', None) or None
+        )
+
     @staticmethod
     def resolve_project(project_name: str = None) -> Stack:
         """
@@ -200,11 +473,8 @@ class ClientUtils:
         project_name = project_name.strip() if project_name else None
 
         if project_name:
-            # Fetch project by name from API
-            api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
             try:
-                project = api_instance.get_stack(project_name)
-                return project
+                return ClientUtils.get_project(project_name)
             except Exception as e:
                 error_message = ClientUtils.extract_error_message(e)
                 raise ValueError(f"Failed to fetch project '{project_name}': {error_message}")
@@ -215,6 +485,31 @@ class ClientUtils:
                 raise ValueError("No current project is set. Please set a project using use_project() or provide project_name parameter.")
             return project
 
+    @staticmethod
+    def get_project_clusters(project_name: str, refresh: bool = False) -> List[AbstractCluster]:
+        """
+        Get all environments of a project.
+
+        The list is served from a short-lived cache so that resolving environments by
+        name does not fetch the full environment list on every tool call.
+
+        Args:
+            project_name: Name of the project.
+            refresh: If True, always fetch from the server and update the cache.
+
+        Returns:
+            List[AbstractCluster]: The environments of the project.
+        """
+        if not refresh:
+            environments = _clusters_cache.get(project_name)
+            if environments is not None:
+                return environments
+
+        api_instance = ClientUtils.get_api(swagger_client.UiStackControllerApi)
+        environments = api_instance.get_clusters(project_name)
+        _clusters_cache.set(project_name, environments)
+        return environments
+
     @staticmethod
     def resolve_environment(env_name: str = None, project: Stack = None) -> AbstractCluster:
         """
@@ -238,9 +533,8 @@ class ClientUtils:
             if not project:
                 raise ValueError("Project is required when resolving environment by env_name.")
 
-            api_instance = swagger_client.UiStackControllerApi(ClientUtils.get_client())
             try:
-                environments = api_instance.get_clusters(project.name)
+                environments = ClientUtils.get_project_clusters(project.name)
                 # Find environment by name
                 found_environment = None
                 for env in environments:
@@ -69,7 +69,7 @@ def remove_nested_property(obj: Dict[str, Any], property_path: str) -> bool:
     parents = []
     
     # Navigate to the parent of the target property, keeping track of parents
-    for i, part in enumerate(parts[:-1]):
+    for part in parts[:-1]:
         if not isinstance(current, dict) or part not in current:
             return False
         parents.append((current, part))
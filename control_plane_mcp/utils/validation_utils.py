@@ -1,7 +1,15 @@
 from jsonschema import Draft7Validator
 from jsonschema import validate, ValidationError
-from typing import Dict, Any
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+from typing import Dict, Any, Tuple
 from copy import deepcopy
+from .cache_utils import TTLCache
+
+# Checked validators for public schemas, keyed by id() of the schema response. Each entry keeps a
+# reference to its schema response, so the id cannot be reused while the entry exists
+_public_schema_validators = TTLCache(ttl=300, maxsize=64)
 
 # resource schema
 resource_schema = {
@@ -49,6 +57,43 @@ def validate_resource(resource_data: Dict[str, Any], resource_spec_schema: Dict[
     return True
 
 
+def _get_public_schema_validator(schema_response: Dict[str, Any]) -> Tuple[Dict[str, Any], Validator]:
+    """
+    Build the JSON schema for a public schema response and a validator for it.
+
+    Checking the schema and creating the validator is only done once per schema response, so
+    validating several resources against the same (cached) schema reuses the validator.
+
+    Args:
+        schema_response: Complete schema response from get_resource_schema_public()
+
+    Returns:
+        Tuple of the JSON schema and its validator
+
+    Raises:
+        SchemaError: If the schema itself is invalid
+    """
+    entry = _public_schema_validators.get(id(schema_response))
+    if entry is not None and entry[0] is schema_response:
+        return entry[1], entry[2]
+
+    # Build complete JSON schema from the public API response
+    json_schema = {
+        "$schema": "https://json-schema.org/draft-07/schema#",
+        "type": schema_response.get("type", "object"),
+        "properties": schema_response.get("properties", {}),
+        "required": schema_response.get("required", []),
+        "additionalProperties": schema_response.get("additional_properties", True)
+    }
+    # Same validator class and schema check as jsonschema.validate()
+    validator_class = validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    validator = validator_class(json_schema)
+
+    _public_schema_validators.set(id(schema_response), (schema_response, json_schema, validator))
+    return json_schema, validator
+
+
 def validate_resource_with_public_schema(content: Dict[str, Any], schema_response: Dict[str, Any]) -> bool:
     """
     Validates a resource's configuration content against the organization's complete schema
@@ -73,18 +118,13 @@ def validate_resource_with_public_schema(content: Dict[str, Any], schema_respons
     if not schema_response or not schema_response.get("properties"):
         raise ValueError("Invalid schema response. Schema must contain properties definition.")
     
-    # Build complete JSON schema from the public API response
-    json_schema = {
-        "$schema": "https://json-schema.org/draft-07/schema#",
-        "type": schema_response.get("type", "object"),
-        "properties": schema_response.get("properties", {}),
-        "required": schema_response.get("required", []),
-        "additionalProperties": schema_response.get("additional_properties", True)
-    }
-    
     try:
+        json_schema, validator = _get_public_schema_validator(schema_response)
+
         # Perform strict JSON schema validation
-        validate(instance=content, schema=json_schema)
+        error = best_match(validator.iter_errors(content))
+        if error is not None:
+            raise error
         return True
         
     except ValidationError as e:
@@ -0,0 +1,51 @@
+import datetime
+import unittest
+from types import SimpleNamespace
+
+import swagger_client
+from swagger_client.models import Stack
+
+from control_plane_mcp.utils.client_utils import FacetsApiClient
+
+
+class FacetsApiClientDeserializeTest(unittest.TestCase):
+    """
+    FacetsApiClient.deserialize hands orjson-decoded data to the SDK's private model mapper.
+    These tests fail if an SDK upgrade renames or changes that mapper.
+    """
+
+    def setUp(self):
+        self.client = FacetsApiClient()
+
+    def deserialize(self, body: bytes, response_type: str):
+        return self.client.deserialize(SimpleNamespace(data=body), response_type)
+
+    def test_model(self):
+        stack = self.deserialize(b'{"name": "demo", "vcsUrl": "https://example.com/demo.git"}', "Stack")
+        self.assertIsInstance(stack, Stack)
+        self.assertEqual(stack.name, "demo")
+        self.assertEqual(stack.vcs_url, "https://example.com/demo.git")
+
+    def test_list_of_models(self):
+        stacks = self.deserialize(b'[{"name": "a"}, {"name": "b"}]', "list[Stack]")
+        self.assertEqual([stack.name for stack in stacks], ["a", "b"])
+        self.assertTrue(all(isinstance(stack, Stack) for stack in stacks))
+
+    def test_dict_and_primitives(self):
+        self.assertEqual(self.deserialize(b'{"a": 1, "b": 2}', "dict(str, int)"), {"a": 1, "b": 2})
+        self.assertEqual(self.deserialize(b'true', "bool"), True)
+        self.assertEqual(self.deserialize(b'"2024-01-02"', "date"), datetime.date(2024, 1, 2))
+
+    def test_matches_stock_client(self):
+        stock_client = swagger_client.ApiClient()
+        for body, response_type in [
+            (b'{"name": "demo", "relativePath": "stacks/demo"}', "Stack"),
+            (b'[{"name": "a"}]', "list[Stack]"),
+            (b'plain text', "str"),
+        ]:
+            expected = stock_client.deserialize(SimpleNamespace(data=body), response_type)
+            self.assertEqual(self.deserialize(body, response_type), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()